@@ -11,14 +11,16 @@ Usage:
 """
 
 import argparse
-import subprocess
 import sys
 from pathlib import Path
 
 # Get the root directory
 SCRIPT_DIR = Path(__file__).resolve().parent
 ROOT_DIR = SCRIPT_DIR.parent.parent.parent
-ORGANIZE_SCRIPT = ROOT_DIR / "git-hooks" / "checks" / "python" / "organize_docs.py"
+
+# The organizer runs in-process, saving a second interpreter start-up
+sys.path.insert(0, str(ROOT_DIR / "git-hooks" / "checks" / "python"))
+from organize_docs import organize_documentation  # noqa: E402
 
 
 def main():
@@ -36,26 +38,19 @@ def main():
     if args.auto_fix:
         # Run the organizer in auto-move mode
         print("Auto-organizing scattered documentation files...")
-        result = subprocess.run(
-            [sys.executable, str(ORGANIZE_SCRIPT), "--auto-move"], cwd=ROOT_DIR
-        )
+        result = organize_documentation(dry_run=False)
 
-        if result.returncode == 0:
+        if result.success:
             print("SUCCESS: Documentation organization completed successfully")
         else:
             print("ERROR: Documentation organization failed")
 
-        sys.exit(result.returncode)
+        sys.exit(result.exit_code)
     else:
         # Run in dry-run mode to detect issues
-        result = subprocess.run(
-            [sys.executable, str(ORGANIZE_SCRIPT), "--dry-run"],
-            cwd=ROOT_DIR,
-            capture_output=True,
-            text=True,
-        )
+        result = organize_documentation(dry_run=True, verbose=False)
 
-        if result.returncode == 0:
+        if not result.proposed_moves:
             # No files need to be moved
             print("SUCCESS: All documentation files are properly organized")
             sys.exit(0)
@@ -63,7 +58,10 @@ def main():
             # Files need to be moved
             print("WARNING: Scattered documentation files detected!")
             print("\nThe following files should be organized:")
-            print(result.stdout)
+            for move in result.proposed_moves:
+                print(f"\n{move.description()}")
+                for issue in move.issues:
+                    print(f"   WARNING: {issue}")
             print("\nTo automatically organize these files, run:")
             print("  python git-hooks/checks/python/organize_docs.py --auto-move")
             print(
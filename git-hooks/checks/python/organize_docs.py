@@ -33,17 +33,17 @@ import re
 import shutil
 import sys
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
-
-try:
-    import yaml
-except ImportError:
-    print("ERROR: PyYAML not installed. Run: pip install pyyaml")
-    sys.exit(1)
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
 ROOT = (
     pathlib.Path(__file__).resolve().parents[3]
 )  # Go up from git-hooks/checks/python/
+
+# Front-matter parsing is shared with scripts/validate_docs.py
+sys.path.insert(0, str(ROOT / "scripts"))
+from docs_frontmatter import MarkdownDocument  # noqa: E402
+from docs_parse_cache import ParseCache  # noqa: E402
+
 DOCS_DIR = ROOT / "docs"
 INBOX_DIR = DOCS_DIR / "_inbox"
 
@@ -119,96 +119,265 @@ DOC_TYPE_DIRS = {
 }
 
 
+# File types the organizer handles, in the order they are listed
+DOC_SUFFIXES = (".md", ".txt")
+
+
+def find_doc_files(
+    top: pathlib.Path, recursive: bool = True
+) -> Dict[str, List[pathlib.Path]]:
+    """Find documentation files under ``top``, grouped by suffix.
+
+    Walks the tree once with os.scandir, matching every suffix in
+    DOC_SUFFIXES in the same pass, and never descends into EXCLUDE_DIRS
+    or symlinked directories. Directory entry types come from the scan
+    itself, so files are not stat()ed. Within each suffix, paths are in
+    the order pathlib's rglob() yields them (each directory's files, then
+    its subdirectories, depth first).
+    """
+    found: Dict[str, List[pathlib.Path]] = {suffix: [] for suffix in DOC_SUFFIXES}
+    stack = [top]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive and entry.name not in EXCLUDE_DIRS:
+                                subdirs.append(directory / entry.name)
+                            continue
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    # Everything from the last dot, like a "*.md" pattern
+                    name = os.path.normcase(entry.name)
+                    suffix = name[name.rfind(".") :]
+                    if suffix in found:
+                        found[suffix].append(directory / entry.name)
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+    return found
+
+
+# Inline markdown links; group 1 is the link target
+LINK_PATTERN = re.compile(r"\]\(([^)]+)\)")
+
+# Link targets that aren't relative paths in the repository
+NON_FILE_LINK_PREFIXES = ("http://", "https://", "mailto:", "#", "/")
+
+
+class LinkGraph:
+    """Relative links between markdown files, as source -> target edges.
+
+    Sources are added once each: their text is scanned with LINK_PATTERN and
+    every relative link is resolved by path arithmetic alone, so building
+    the graph does no stat() calls. Paths are normalized absolute strings.
+    """
+
+    def __init__(self):
+        self.texts: Dict[str, str] = {}
+        # source -> (start, end, target) of each link's path in the text
+        self.outbound: Dict[str, List[Tuple[int, int, str]]] = {}
+        self.inbound: Dict[str, Set[str]] = {}
+
+    def add(self, source: str, text: str):
+        directory = os.path.dirname(source)
+        links = []
+        for match in LINK_PATTERN.finditer(text):
+            link = match.group(1)
+            if link.startswith(NON_FILE_LINK_PREFIXES) or "://" in link:
+                continue
+            # The fragment (if any) is kept as written
+            link_path = link.split("#", 1)[0]
+            target = os.path.normpath(os.path.join(directory, link_path))
+            start = match.start(1)
+            links.append((start, start + len(link_path), target))
+            self.inbound.setdefault(target, set()).add(source)
+        self.texts[source] = text
+        self.outbound[source] = links
+
+    def affected_sources(self, moves: Dict[str, str]) -> Set[str]:
+        """Sources that moved or link to a file that moved."""
+        affected = {source for source in moves if source in self.outbound}
+        for old_path in moves:
+            affected.update(self.inbound.get(old_path, ()))
+        return affected
+
+    def rewrite(
+        self, source: str, moves: Dict[str, str], existed: Callable[[str], bool]
+    ) -> Optional[str]:
+        """Text of ``source`` with its links fixed up for ``moves``.
+
+        Only links whose source or target moved, and whose target
+        ``existed`` before the moves, are changed. Returns None if nothing
+        changed.
+        """
+        new_source = moves.get(source, source)
+        text = self.texts[source]
+        pieces = []
+        position = 0
+        for start, end, target in self.outbound[source]:
+            new_target = moves.get(target, target)
+            if (new_source == source and new_target == target) or not existed(target):
+                continue
+            directory = os.path.dirname(new_source)
+            if os.path.normpath(os.path.join(directory, text[start:end])) == new_target:
+                # Still resolves, e.g. both files moved to the same directory
+                continue
+            new_link = os.path.relpath(new_target, directory).replace(os.sep, "/")
+            if text[end - 1] == "/":
+                new_link += "/"
+            pieces += [text[position:start], new_link]
+            position = end
+        if not pieces:
+            return None
+        pieces.append(text[position:])
+        return "".join(pieces)
+
+
 class DocumentFile:
-    """Represents a markdown or text document with metadata."""
+    """Represents a markdown or text document with metadata.
+
+    Creating one does no I/O. The front-matter header is read and analyzed
+    on first access to ``frontmatter``, ``suggested_location`` or
+    ``issues`` (through ``parse_cache`` if given, which may skip reading
+    it); only the parsed metadata is kept. The body is read from disk each
+    time ``content`` or ``body`` is used, which only happens for files
+    being moved or rewritten.
+    """
+
+    __slots__ = (
+        "_analyzed",
+        "_frontmatter",
+        "_issues",
+        "_parse_cache",
+        "_suggested_location",
+        "path",
+    )
 
-    def __init__(self, path: pathlib.Path):
+    def __init__(self, path: pathlib.Path, parse_cache: Optional[ParseCache] = None):
         self.path = path
-        self.relative_path = path.relative_to(ROOT)
-        self.content = ""
-        self.frontmatter: Optional[Dict[str, Any]] = None
-        self.body = ""
-        self.suggested_location: Optional[pathlib.Path] = None
-        self.issues: List[str] = []
-
-        self._load_content()
-        self._analyze()
-
-    def _load_content(self):
-        """Load file content."""
+        self._parse_cache = parse_cache
+        self._analyzed = False
+        self._frontmatter: Optional[Dict[str, Any]] = None
+        self._suggested_location: Optional[pathlib.Path] = None
+        self._issues: List[str] = []
+
+    @property
+    def relative_path(self) -> pathlib.Path:
+        return self.path.relative_to(ROOT)
+
+    @property
+    def frontmatter(self) -> Optional[Dict[str, Any]]:
+        self._ensure_analyzed()
+        return self._frontmatter
+
+    @property
+    def suggested_location(self) -> Optional[pathlib.Path]:
+        self._ensure_analyzed()
+        return self._suggested_location
+
+    @property
+    def issues(self) -> List[str]:
+        self._ensure_analyzed()
+        return self._issues
+
+    @property
+    def content(self) -> str:
+        """Full file content, read from disk."""
         try:
-            self.content = self.path.read_text(encoding="utf-8")
-        except Exception as e:
-            self.issues.append(f"Failed to read file: {e}")
-            return
+            return MarkdownDocument(self.path).text
+        except Exception:
+            return ""
+
+    @property
+    def body(self) -> str:
+        """Content after the front-matter, read from disk."""
+        try:
+            document = MarkdownDocument(self.path)
+        except Exception:
+            return ""
+        if self.frontmatter is None or "_parse_error" in self.frontmatter:
+            return document.text
+        return document.body
+
+    def _ensure_analyzed(self):
+        if not self._analyzed:
+            self._analyzed = True
+            self._analyze()
 
     def _analyze(self):
-        """Analyze content and determine suggested location."""
-        if not self.content:
+        """Analyze front-matter and determine suggested location."""
+        # For .txt files, we don't expect YAML frontmatter, so the header
+        # isn't read
+        try:
+            if self.path.suffix.lower() == ".txt":
+                if self.path.stat().st_size == 0:
+                    return
+            else:
+                if self._parse_cache is not None:
+                    document = self._parse_cache.open(self.path)
+                else:
+                    document = MarkdownDocument(self.path)
+                if document.empty:
+                    return
+                self._frontmatter = self._extract_frontmatter(document)
+        except Exception as e:
+            self._issues.append(f"Failed to read file: {e}")
             return
 
-        # Extract frontmatter
-        self.frontmatter, self.body = self._extract_frontmatter()
-
         # Determine suggested location
         self._suggest_location()
 
-    def _extract_frontmatter(self) -> Tuple[Optional[Dict], str]:
-        """Extract YAML front-matter from content."""
-        # For .txt files, we don't expect YAML frontmatter, so return None
-        if self.path.suffix.lower() == ".txt":
-            return None, self.content
-
-        match = re.match(r"^---\r?\n(.*?)\r?\n---\r?\n", self.content, re.S)
-        if not match:
-            return None, self.content
-
-        try:
-            meta = yaml.safe_load(match.group(1))
-            body = self.content[match.end() :]
-            return meta or {}, body
-        except yaml.YAMLError as e:
-            self.issues.append(f"YAML parse error: {e}")
-            return {"_parse_error": str(e)}, self.content
+    def _extract_frontmatter(self, document: MarkdownDocument) -> Optional[Dict]:
+        """Extract YAML front-matter from the file header."""
+        meta = document.frontmatter
+        if meta and "_parse_error" in meta:
+            self._issues.append(f"YAML parse error: {meta['_parse_error']}")
+        return meta
 
     def _suggest_location(self):
         """Suggest where this document should be located."""
         # If already in docs/, check if it's in the right place
         if is_relative_to(self.path, DOCS_DIR):
-            if self.frontmatter and "doc_type" in self.frontmatter:
-                doc_type = self.frontmatter["doc_type"]
+            if self._frontmatter and "doc_type" in self._frontmatter:
+                doc_type = self._frontmatter["doc_type"]
                 if doc_type in DOC_TYPE_DIRS:
                     expected_dir = DOCS_DIR / DOC_TYPE_DIRS[doc_type]
                     if not is_relative_to(self.path, expected_dir):
-                        self.suggested_location = expected_dir / self.path.name
-                        self.issues.append(
+                        self._suggested_location = expected_dir / self.path.name
+                        self._issues.append(
                             f"Should be in {DOC_TYPE_DIRS[doc_type]}/ based on doc_type"
                         )
             return
 
         # If has proper frontmatter, suggest appropriate directory
-        if self.frontmatter and "doc_type" in self.frontmatter:
-            doc_type = self.frontmatter["doc_type"]
+        if self._frontmatter and "doc_type" in self._frontmatter:
+            doc_type = self._frontmatter["doc_type"]
             if doc_type in DOC_TYPE_DIRS:
-                self.suggested_location = (
+                self._suggested_location = (
                     DOCS_DIR / DOC_TYPE_DIRS[doc_type] / self.path.name
                 )
             else:
-                self.suggested_location = INBOX_DIR / self.path.name
-                self.issues.append(f"Invalid doc_type '{doc_type}', moving to inbox")
+                self._suggested_location = INBOX_DIR / self.path.name
+                self._issues.append(f"Invalid doc_type '{doc_type}', moving to inbox")
         else:
             # No frontmatter or invalid - goes to inbox
-            self.suggested_location = INBOX_DIR / self.path.name
-            if not self.frontmatter:
+            self._suggested_location = INBOX_DIR / self.path.name
+            if not self._frontmatter:
                 # For .txt files, this is expected behavior
                 if self.path.suffix.lower() == ".txt":
-                    self.issues.append(
+                    self._issues.append(
                         "Text file without front-matter, moving to inbox"
                     )
                 else:
-                    self.issues.append("Missing YAML front-matter, moving to inbox")
+                    self._issues.append("Missing YAML front-matter, moving to inbox")
             else:
-                self.issues.append("Missing doc_type in front-matter, moving to inbox")
+                self._issues.append("Missing doc_type in front-matter, moving to inbox")
 
     def should_be_moved(self) -> bool:
         """Check if this file should be moved."""
@@ -226,25 +395,77 @@ class DocumentFile:
         return f"{from_rel} → {to_rel}"
 
 
+class ProposedMove(NamedTuple):
+    """A file the organizer moves (or would move in a dry run)."""
+
+    source: pathlib.Path
+    target: pathlib.Path
+    issues: List[str]
+
+    def description(self) -> str:
+        return f"{self.source.relative_to(ROOT)} → {self.target.relative_to(ROOT)}"
+
+
+class OrganizationResult(NamedTuple):
+    """Outcome of organize_documentation()."""
+
+    summary: Dict[str, Any]
+    proposed_moves: List[ProposedMove]
+    moves_performed: List[Tuple[pathlib.Path, pathlib.Path]]
+    failed_moves: List[Tuple[pathlib.Path, str]]
+    dry_run: bool
+
+    @property
+    def success(self) -> bool:
+        return not self.failed_moves
+
+    @property
+    def exit_code(self) -> int:
+        """1 if moves failed, or are still needed after a dry run."""
+        if not self.success or (self.dry_run and self.proposed_moves):
+            return 1
+        return 0
+
+
 class DocumentOrganizer:
     """Main class for organizing documentation."""
 
-    def __init__(self, dry_run: bool = True, auto_move: bool = False):
+    def __init__(
+        self,
+        dry_run: bool = True,
+        auto_move: bool = False,
+        use_cache: bool = True,
+        verbose: bool = True,
+    ):
         self.dry_run = dry_run
         self.auto_move = auto_move
+        # Progress messages; the print_* methods always print
+        self.verbose = verbose
+        # Parsed headers, shared with scripts/validate_docs.py
+        self.parse_cache = (
+            ParseCache(DOCS_DIR / "index" / ".parse-cache.json", ROOT)
+            if use_cache
+            else None
+        )
         self.documents: List[DocumentFile] = []
         self.moves_performed: List[Tuple[pathlib.Path, pathlib.Path]] = []
+        self.failed_moves: List[Tuple[pathlib.Path, str]] = []
+
+    def log(self, message: str = ""):
+        if self.verbose:
+            print(message)
 
     def scan_repository(self) -> List[DocumentFile]:
         """Scan repository for markdown and text files at root level only."""
-        print("Scanning root level for markdown and text files...")
+        self.log("Scanning root level for markdown and text files...")
 
         found_files = []
         excluded_count = 0
 
         # Scan root level files (*.md and *.txt directly in ROOT)
-        for pattern in ["*.md", "*.txt"]:
-            for doc_file in ROOT.glob(pattern):
+        root_files = find_doc_files(ROOT, recursive=False)
+        for suffix in DOC_SUFFIXES:
+            for doc_file in root_files[suffix]:
                 # Skip excluded files
                 if doc_file.name in EXCLUDE_FILES:
                     excluded_count += 1
@@ -257,10 +478,12 @@ class DocumentOrganizer:
 
                 found_files.append(doc_file)
 
-        # Also check docs/ directory for files that might need reorganization
+        # Also check docs/ directory for files that might need reorganization,
+        # in a single walk that skips excluded directories
         if DOCS_DIR.exists():
-            for pattern in ["*.md", "*.txt"]:
-                for doc_file in DOCS_DIR.rglob(pattern):
+            docs_files = find_doc_files(DOCS_DIR)
+            for suffix in DOC_SUFFIXES:
+                for doc_file in docs_files[suffix]:
                     # Skip files already in proper subdirectories unless they're misplaced
                     relative_to_docs = doc_file.relative_to(DOCS_DIR)
 
@@ -271,14 +494,14 @@ class DocumentOrganizer:
                     else:
                         found_files.append(doc_file)
 
-        print(
+        self.log(
             f"Found {len(found_files)} documentation files (excluded {excluded_count})"
         )
 
         # Analyze each file
         self.documents = []
         for file_path in found_files:
-            doc = DocumentFile(file_path)
+            doc = DocumentFile(file_path, self.parse_cache)
             self.documents.append(doc)
 
         return self.documents
@@ -323,6 +546,12 @@ class DocumentOrganizer:
                     summary["moves_by_type"].get(move_type, 0) + 1
                 )
 
+        if self.parse_cache is not None:
+            self.parse_cache.prune(
+                {str(doc.relative_path).replace("\\", "/") for doc in self.documents}
+            )
+            self.parse_cache.save()
+
         return summary
 
     def print_analysis(self, summary: Dict[str, Any]):
@@ -370,14 +599,14 @@ class DocumentOrganizer:
         moves = [doc for doc in self.documents if doc.should_be_moved()]
 
         if not moves:
-            print("No moves to perform.")
+            self.log("No moves to perform.")
             return True
 
         if self.dry_run:
-            print(f"\nDRY RUN: Would move {len(moves)} files")
+            self.log(f"\nDRY RUN: Would move {len(moves)} files")
             return True
 
-        print(f"\nMoving {len(moves)} files...")
+        self.log(f"\nMoving {len(moves)} files...")
 
         success_count = 0
 
@@ -389,60 +618,77 @@ class DocumentOrganizer:
                 # Move the file
                 shutil.move(str(doc.path), str(doc.suggested_location))
 
-                print(f"Moved: {doc.get_move_description()}")
+                self.log(f"Moved: {doc.get_move_description()}")
                 self.moves_performed.append((doc.path, doc.suggested_location))
                 success_count += 1
 
             except Exception as e:
-                print(f"Failed to move {doc.path}: {e}")
+                self.log(f"Failed to move {doc.path}: {e}")
+                self.failed_moves.append((doc.path, str(e)))
 
-        print(f"\nSuccessfully moved {success_count}/{len(moves)} files")
+        self.log(f"\nSuccessfully moved {success_count}/{len(moves)} files")
         return success_count == len(moves)
 
     def update_cross_references(self):
-        """Update cross-references in moved files (basic implementation)."""
+        """Fix links to and from the moved files across the repository.
+
+        Every markdown file is scanned once into a LinkGraph; the files
+        linking to a moved file, and the moved files themselves, are then
+        rewritten in one batch. A link is only changed if its target
+        existed before the moves, and each distinct target is checked once.
+        """
         if not self.moves_performed or self.dry_run:
             return
 
-        print("\nUpdating cross-references...")
+        self.log("\nUpdating cross-references...")
 
-        # This is a basic implementation - could be enhanced
-        for old_path, new_path in self.moves_performed:
-            try:
-                content = new_path.read_text(encoding="utf-8")
+        moves = {str(old): str(new) for old, new in self.moves_performed}
+        moved_to = set(moves.values())
 
-                # Update relative links that might be broken
-                # This is a simple regex - could be more sophisticated
-                updated_content = content
-
-                # Look for markdown links like [text](../file.md)
-                def update_link(match, old_p=old_path, new_p=new_path):
-                    link_path = match.group(1)
-                    if link_path.startswith(("http://", "https://", "#")):
-                        return match.group(0)  # Don't change external links or anchors
-
-                    # Try to resolve the link relative to new location
-                    try:
-                        old_target = old_p.parent / link_path
-                        if old_target.exists():
-                            # Calculate new relative path
-                            new_relative = pathlib.Path(
-                                os.path.relpath(old_target, new_p.parent)
-                            )
-                            return f"]({new_relative})"
-                    except Exception:
-                        pass
+        # Files are read from where they are now, but linked as they were
+        graph = LinkGraph()
+        for path in find_doc_files(ROOT)[".md"]:
+            new_path = str(path)
+            if new_path in moved_to:
+                continue
+            try:
+                graph.add(new_path, path.read_text(encoding="utf-8"))
+            except Exception as e:
+                self.log(f"  Failed to read {path}: {e}")
+        for old_path, new_path in moves.items():
+            if new_path.endswith(".md"):
+                try:
+                    graph.add(
+                        old_path, pathlib.Path(new_path).read_text(encoding="utf-8")
+                    )
+                except Exception as e:
+                    self.log(f"  Failed to read {new_path}: {e}")
 
-                    return match.group(0)  # Return unchanged if we can't fix it
+        existed_cache: Dict[str, bool] = {}
 
-                updated_content = re.sub(r"\]\(([^)]+)\)", update_link, updated_content)
+        def existed(target: str) -> bool:
+            if target not in existed_cache:
+                if target in moves:
+                    existed_cache[target] = True
+                elif target in moved_to:
+                    existed_cache[target] = False
+                else:
+                    existed_cache[target] = os.path.exists(target)
+            return existed_cache[target]
 
-                if updated_content != content:
-                    new_path.write_text(updated_content, encoding="utf-8")
-                    print(f"  Updated links in {new_path.relative_to(ROOT)}")
+        updates = {}
+        for source in sorted(graph.affected_sources(moves)):
+            updated = graph.rewrite(source, moves, existed)
+            if updated is not None:
+                updates[moves.get(source, source)] = updated
 
+        for path, content in updates.items():
+            new_path = pathlib.Path(path)
+            try:
+                new_path.write_text(content, encoding="utf-8")
+                self.log(f"  Updated links in {new_path.relative_to(ROOT)}")
             except Exception as e:
-                print(f"  Failed to update links in {new_path}: {e}")
+                self.log(f"  Failed to update links in {new_path}: {e}")
 
     def generate_organization_report(self):
         """Generate a report of the organization process."""
@@ -492,7 +738,49 @@ according to the R-DOC-001 rule.
 """
 
         report_path.write_text(report_content, encoding="utf-8")
-        print(f"\nOrganization report saved to: {report_path.relative_to(ROOT)}")
+        self.log(f"\nOrganization report saved to: {report_path.relative_to(ROOT)}")
+
+
+def organize_documentation(
+    dry_run: bool = True,
+    update_cross_references: bool = True,
+    use_cache: bool = True,
+    verbose: bool = True,
+) -> OrganizationResult:
+    """Scan, analyze and (unless ``dry_run``) organize the documentation.
+
+    This is the command line tool without argument parsing and exiting, for
+    callers such as git-hooks/checks/general/organize_scattered_docs.py that
+    run it in-process. With ``verbose`` the progress, analysis and proposed
+    moves are printed like the tool does; otherwise nothing is printed.
+    """
+    organizer = DocumentOrganizer(
+        dry_run=dry_run, auto_move=not dry_run, use_cache=use_cache, verbose=verbose
+    )
+    organizer.scan_repository()
+    summary = organizer.analyze_organization()
+    if verbose:
+        organizer.print_analysis(summary)
+        organizer.print_detailed_moves()
+
+    proposed_moves = [
+        ProposedMove(doc.path, doc.suggested_location, list(doc.issues))
+        for doc in organizer.documents
+        if doc.should_be_moved()
+    ]
+
+    if proposed_moves and organizer.perform_moves() and not dry_run:
+        if update_cross_references:
+            organizer.update_cross_references()
+        organizer.generate_organization_report()
+
+    return OrganizationResult(
+        summary=summary,
+        proposed_moves=proposed_moves,
+        moves_performed=list(organizer.moves_performed),
+        failed_moves=list(organizer.failed_moves),
+        dry_run=dry_run,
+    )
 
 
 def main():
@@ -515,6 +803,11 @@ def main():
         action="store_true",
         help="Skip updating cross-references in moved files",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse every front-matter header instead of using the parse cache",
+    )
 
     args = parser.parse_args()
 
@@ -531,48 +824,27 @@ def main():
     else:
         print("MOVE mode (files will be moved)")
 
-    # Initialize organizer
-    organizer = DocumentOrganizer(dry_run=args.dry_run, auto_move=args.auto_move)
-
-    # Scan repository
-    organizer.scan_repository()
+    result = organize_documentation(
+        dry_run=args.dry_run,
+        update_cross_references=not args.no_cross_ref_update,
+        use_cache=not args.no_cache,
+    )
 
-    # Analyze organization
-    summary = organizer.analyze_organization()
-    organizer.print_analysis(summary)
-
-    # Show detailed moves
-    organizer.print_detailed_moves()
-
-    # Perform moves if requested
-    if summary["files_to_move"] > 0:
-        success = organizer.perform_moves()
-
-        if success and not args.dry_run:
-            # Update cross-references
-            if not args.no_cross_ref_update:
-                organizer.update_cross_references()
-
-            # Generate report
-            organizer.generate_organization_report()
-
-            print("\nDocumentation organization completed!")
-            print("   Next steps:")
-            print("   1. Review files in docs/_inbox/")
-            print("   2. Add proper front-matter to files missing it")
-            print("   3. Run: python scripts/validate_docs.py")
-        elif not success:
-            print("\nSome moves failed. Check the errors above.")
-            sys.exit(1)
-    else:
+    if not result.proposed_moves:
         print("\nAll documentation is already properly organized!")
-
-    # Exit with appropriate code
-    if args.dry_run and summary["files_to_move"] > 0:
-        print(f"\nRun with --auto-move to organize {summary['files_to_move']} files")
-        sys.exit(1)  # Indicate action needed
+    elif not result.success:
+        print("\nSome moves failed. Check the errors above.")
+    elif not args.dry_run:
+        print("\nDocumentation organization completed!")
+        print("   Next steps:")
+        print("   1. Review files in docs/_inbox/")
+        print("   2. Add proper front-matter to files missing it")
+        print("   3. Run: python scripts/validate_docs.py")
     else:
-        sys.exit(0)
+        print(f"\nRun with --auto-move to organize {len(result.proposed_moves)} files")
+
+    # 1 indicates action needed
+    sys.exit(result.exit_code)
 
 
 if __name__ == "__main__":
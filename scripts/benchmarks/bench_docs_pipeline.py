@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+Documentation pipeline benchmark
+
+Synthesizes docs trees with realistic front-matter (plus inbox drafts,
+near-duplicates and pasted sections) and times each stage of the
+documentation tooling on them:
+
+- validate_docs.process_documents() (cold, then with a warm registry cache)
+- validate_docs.validate_canonical_uniqueness()
+- validate_docs.detect_near_duplicates() and find_duplicate_clusters()
+- validate_docs.detect_shared_sections() and find_shared_section_pairs()
+- validate_docs.generate_registry()
+- organize_docs.DocumentOrganizer.scan_repository() and analyze_organization()
+
+Each tree size runs in a fresh subprocess so peak RSS is measured per size.
+
+Usage:
+    python scripts/benchmarks/bench_docs_pipeline.py [--sizes N ...] [--jobs N]
+    python scripts/benchmarks/bench_docs_pipeline.py --json results.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import pathlib
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "git-hooks" / "checks" / "python"))
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+DOC_TYPE_DIRS = {
+    "spec": "specs",
+    "rfc": "rfcs",
+    "adr": "adrs",
+    "plan": "plans",
+    "finding": "findings",
+    "guide": "guides",
+    "glossary": "glossary",
+    "reference": "guides",
+}
+STATUSES = ["draft", "active", "active", "active", "superseded", "archived"]
+
+WORDS = [
+    "agent",
+    "alignment",
+    "analytics",
+    "architecture",
+    "asset",
+    "binding",
+    "build",
+    "cache",
+    "canonical",
+    "chunk",
+    "cli",
+    "combat",
+    "config",
+    "console",
+    "contract",
+    "crate",
+    "dungeon",
+    "editor",
+    "engine",
+    "entity",
+    "event",
+    "feature",
+    "fixture",
+    "framework",
+    "game",
+    "graph",
+    "handover",
+    "hook",
+    "index",
+    "input",
+    "integration",
+    "inventory",
+    "kernel",
+    "layout",
+    "level",
+    "loader",
+    "map",
+    "memory",
+    "migration",
+    "model",
+    "module",
+    "monitor",
+    "network",
+    "pipeline",
+    "player",
+    "plugin",
+    "policy",
+    "quest",
+    "registry",
+    "render",
+    "report",
+    "repository",
+    "runtime",
+    "save",
+    "scene",
+    "schema",
+    "script",
+    "sequence",
+    "service",
+    "session",
+    "spec",
+    "storage",
+    "system",
+    "terminal",
+    "test",
+    "theme",
+    "tile",
+    "timeline",
+    "toolkit",
+    "trace",
+    "turn",
+    "ui",
+    "update",
+    "validation",
+    "viewport",
+    "widget",
+    "window",
+    "workflow",
+    "world",
+]
+FILLER = [
+    "the",
+    "a",
+    "an",
+    "of",
+    "to",
+    "and",
+    "for",
+    "with",
+    "in",
+    "on",
+    "by",
+    "this",
+    "that",
+    "is",
+    "are",
+    "we",
+    "it",
+    "be",
+    "as",
+    "from",
+    "when",
+    "should",
+    "must",
+    "can",
+    "will",
+    "not",
+    "all",
+    "each",
+    "our",
+]
+
+
+def sentence(rng: random.Random, length: int) -> str:
+    words = rng.choices(WORDS, k=length // 2) + rng.choices(FILLER, k=length // 2)
+    rng.shuffle(words)
+    return " ".join(words).capitalize() + "."
+
+
+def make_body(rng: random.Random) -> str:
+    parts = []
+    for section in range(rng.randint(2, 5)):
+        parts.append(f"## {sentence(rng, 4)[:-1]}")
+        for _ in range(rng.randint(1, 3)):
+            parts.append(" ".join(sentence(rng, rng.randint(8, 20)) for _ in range(4)))
+        if section % 2:
+            parts.append(
+                f"```csharp\npublic class {rng.choice(WORDS).title()}Service {{ }}\n```"
+            )
+        if rng.random() < 0.5:
+            parts.append(
+                f"See `{rng.choice(WORDS)}.json` and "
+                f"https://example.com/{rng.choice(WORDS)}/{rng.randint(1, 999)}."
+            )
+    return "\n\n".join(parts) + "\n"
+
+
+def make_frontmatter(rng: random.Random, number: int, doc_type: str, title: str) -> str:
+    year = rng.choice([2024, 2025])
+    tags = ", ".join(sorted(set(rng.choices(WORDS, k=rng.randint(1, 5)))))
+    related = f"DOC-{year}-{rng.randint(1, max(1, number)):05d}"
+    return (
+        "---\n"
+        f"doc_id: DOC-{year}-{number:05d}\n"
+        f"title: {title}\n"
+        f"doc_type: {doc_type}\n"
+        f"status: {rng.choice(STATUSES)}\n"
+        f"canonical: {'true' if rng.random() < 0.3 else 'false'}\n"
+        f"created: {year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}\n"
+        f"tags: [{tags}]\n"
+        "summary: >\n"
+        f"  {sentence(rng, 12)}\n"
+        f"related: [{related}]\n"
+        "source:\n"
+        "  author: agent\n"
+        "---\n\n"
+    )
+
+
+def mutate(rng: random.Random, body: str) -> str:
+    """A light edit of ``body`` that stays within SimHash range."""
+    lines = body.split("\n")
+    lines.insert(rng.randrange(len(lines) + 1), sentence(rng, 6))
+    return "\n".join(lines)
+
+
+def borrow_section(rng: random.Random, body: str) -> str:
+    """One ``##`` section of ``body``, to paste into another document."""
+    sections = body.split("\n\n## ")
+    section = rng.choice(sections)
+    return section if section.startswith("## ") else f"## {section}"
+
+
+def write_doc(path: pathlib.Path, text: str) -> None:
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(text)
+
+
+def generate_tree(
+    root: pathlib.Path,
+    count: int,
+    seed: int = 0,
+    inbox_fraction: float = 0.02,
+    duplicate_fraction: float = 0.05,
+) -> None:
+    """Write ``count`` corpus docs (plus inbox drafts) under root/docs."""
+    rng = random.Random(seed)
+    docs = root / "docs"
+    for directory in {*DOC_TYPE_DIRS.values(), "_inbox", "index"}:
+        (docs / directory).mkdir(parents=True, exist_ok=True)
+
+    titles: List[str] = []
+    bodies: List[str] = []
+    for number in range(1, count + 1):
+        doc_type = rng.choice(list(DOC_TYPE_DIRS))
+        if bodies and rng.random() < duplicate_fraction:
+            source = rng.randrange(len(bodies))
+            title, body = titles[source], mutate(rng, bodies[source])
+        else:
+            title, body = sentence(rng, rng.randint(3, 7))[:-1], make_body(rng)
+        titles.append(title)
+        bodies.append(body)
+
+        # A few loose files directly in docs/ for the organizer to place
+        directory = docs if rng.random() < 0.01 else docs / DOC_TYPE_DIRS[doc_type]
+        slug = "-".join(title.lower().split()[:4])
+        write_doc(
+            directory / f"{slug}--DOC-{number:05d}.md",
+            make_frontmatter(rng, number, doc_type, title) + f"# {title}\n\n" + body,
+        )
+
+    # Inbox drafts: half near-duplicates of corpus docs, half new (some with
+    # a section pasted from a corpus doc)
+    for number in range(count + 1, count + 1 + max(1, int(count * inbox_fraction))):
+        doc_type = rng.choice(list(DOC_TYPE_DIRS))
+        if rng.random() < 0.5:
+            source = rng.randrange(len(bodies))
+            title, body = titles[source], mutate(rng, bodies[source])
+        else:
+            title, body = sentence(rng, 5)[:-1], make_body(rng)
+            if rng.random() < 0.5:
+                body += "\n" + borrow_section(rng, rng.choice(bodies))
+        write_doc(
+            docs / "_inbox" / f"draft-{number:06d}.md",
+            make_frontmatter(rng, number, doc_type, title) + f"# {title}\n\n" + body,
+        )
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_pipeline(root: pathlib.Path, jobs: int) -> Dict[str, Any]:
+    """Run every stage against the tree at ``root`` and time it."""
+    import organize_docs
+    import validate_docs
+
+    docs = root / "docs"
+    validate_docs.ROOT = root
+    validate_docs.DOCS = docs
+    validate_docs.INBOX = docs / "_inbox"
+    validate_docs.ARCHIVE = docs / "archive"
+    validate_docs.REGISTRY = docs / "index" / "registry.json"
+    validate_docs.REGISTRY_DB = docs / "index" / "registry.sqlite"
+    validate_docs.REGISTRY_INDEX = docs / "index" / "registry-index.json"
+    validate_docs.CACHE = docs / "index" / ".registry-cache.json"
+    validate_docs.PARSE_CACHE = docs / "index" / ".parse-cache.json"
+    organize_docs.ROOT = root
+    organize_docs.DOCS_DIR = docs
+    organize_docs.INBOX_DIR = docs / "_inbox"
+
+    stages: List[Dict[str, Any]] = []
+
+    def stage(name: str, func: Callable[[], Any]) -> Any:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            result = func()
+            seconds = time.perf_counter() - start
+        stages.append({"stage": name, "seconds": seconds, "peak_rss_mb": peak_rss_mb()})
+        return result
+
+    started = time.perf_counter()
+    entries, errors = stage(
+        "process_documents (cold)",
+        lambda: validate_docs.process_documents(use_cache=True, jobs=jobs),
+    )
+    stage(
+        "process_documents (warm cache)",
+        lambda: validate_docs.process_documents(use_cache=True, jobs=jobs),
+    )
+    inbox_paths = sorted(validate_docs.INBOX.glob("*.md"))
+    inbox_entries, _ = stage(
+        "process_documents (inbox)",
+        lambda: validate_docs.process_documents(
+            use_cache=False, jobs=jobs, paths=inbox_paths
+        ),
+    )
+    entries = entries + inbox_entries
+    canonical = stage(
+        "validate_canonical_uniqueness",
+        lambda: validate_docs.validate_canonical_uniqueness(entries),
+    )
+    duplicates = stage(
+        "detect_near_duplicates",
+        lambda: validate_docs.detect_near_duplicates(entries),
+    )
+    clusters = stage(
+        "find_duplicate_clusters",
+        lambda: validate_docs.find_duplicate_clusters(entries),
+    )
+    shared = stage(
+        "detect_shared_sections",
+        lambda: validate_docs.detect_shared_sections(entries),
+    )
+    shared_pairs = stage(
+        "find_shared_section_pairs",
+        lambda: validate_docs.find_shared_section_pairs(entries),
+    )
+    stage("generate_registry", lambda: validate_docs.generate_registry(entries))
+
+    organizer = organize_docs.DocumentOrganizer(dry_run=True)
+    documents = stage("scan_repository", organizer.scan_repository)
+    stage("analyze_organization", organizer.analyze_organization)
+
+    return {
+        "entries": len(entries),
+        "errors": len(errors),
+        "canonical_conflicts": len(canonical),
+        "near_duplicates": len(duplicates),
+        "duplicate_clusters": len(clusters),
+        "shared_sections": len(shared),
+        "shared_section_pairs": len(shared_pairs),
+        "organizer_files": len(documents),
+        "jobs": jobs,
+        "wall_seconds": time.perf_counter() - started,
+        "peak_rss_mb": peak_rss_mb(),
+        "stages": stages,
+    }
+
+
+def format_mb(value: Optional[float]) -> str:
+    return "n/a" if value is None else f"{value:.1f}"
+
+
+def print_result(size: int, result: Dict[str, Any]) -> None:
+    print(
+        f"=== {size:,} docs (generated in {result['generate_seconds']:.1f}s, "
+        f"jobs={result['jobs']}) ==="
+    )
+    print(f"{'Stage':<34} {'Seconds':>9} {'Peak RSS MB':>12}")
+    print("-" * 57)
+    for item in result["stages"]:
+        print(
+            f"{item['stage']:<34} {item['seconds']:>9.3f} "
+            f"{format_mb(item['peak_rss_mb']):>12}"
+        )
+    print("-" * 57)
+    print(
+        f"{'Total':<34} {result['wall_seconds']:>9.3f} "
+        f"{format_mb(result['peak_rss_mb']):>12}"
+    )
+    print(
+        f"Entries: {result['entries']}, errors: {result['errors']}, "
+        f"canonical conflicts: {result['canonical_conflicts']}, "
+        f"near-duplicates: {result['near_duplicates']}, "
+        f"clusters: {result['duplicate_clusters']}, "
+        f"shared sections: {result['shared_sections']}, "
+        f"shared section pairs: {result['shared_section_pairs']}, "
+        f"organizer files: {result['organizer_files']}"
+    )
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the documentation pipeline on synthetic docs trees"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        metavar="N",
+        help="Corpus sizes to benchmark (default: 1000 10000 100000)",
+    )
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="Also write results as JSON")
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the generated trees for inspection"
+    )
+    # Internal: run the stages in this process against an existing tree
+    parser.add_argument("--run", metavar="ROOT", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        result = run_pipeline(pathlib.Path(args.run), args.jobs)
+        print(json.dumps(result))
+        return
+
+    results: Dict[str, Any] = {}
+    for size in args.sizes:
+        root = pathlib.Path(tempfile.mkdtemp(prefix=f"docs-bench-{size}-"))
+        try:
+            start = time.perf_counter()
+            generate_tree(root, size, seed=args.seed)
+            generate_seconds = time.perf_counter() - start
+
+            completed = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--run",
+                    str(root),
+                    "--jobs",
+                    str(args.jobs),
+                ],
+                capture_output=True,
+                text=True,
+            )
+            if completed.returncode != 0:
+                print(completed.stdout + completed.stderr, file=sys.stderr)
+                sys.exit(completed.returncode)
+
+            result = json.loads(completed.stdout.splitlines()[-1])
+            result["generate_seconds"] = generate_seconds
+            results[str(size)] = result
+            print_result(size, result)
+        finally:
+            if args.keep:
+                print(f"Kept tree: {root}")
+            else:
+                shutil.rmtree(root, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
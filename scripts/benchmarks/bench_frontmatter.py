@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Front-matter parsing benchmark
+
+Compares the original regex + yaml.safe_load approach with the shared
+scripts/docs_frontmatter.py parser on every markdown file with front-matter
+under docs/ (or the given directory).
+
+Usage:
+    python scripts/benchmarks/bench_frontmatter.py [--repeat N] [DIR]
+"""
+
+import argparse
+import pathlib
+import re
+import sys
+import time
+from typing import Callable, List
+
+import yaml
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import docs_frontmatter  # noqa: E402
+
+FRONTMATTER_RE = re.compile(r"^---\r?\n(.*?)\r?\n---\r?\n", re.S)
+
+
+def baseline(text: str):
+    """The pre-docs_frontmatter implementation."""
+    match = re.match(r"^---\r?\n(.*?)\r?\n---\r?\n", text, re.S)
+    if not match:
+        return None, text
+    return yaml.safe_load(match.group(1)) or {}, text[match.end() :]
+
+
+def csafe_only(text: str):
+    """Regex split + libyaml, without the restricted parser."""
+    header, body = docs_frontmatter.split_frontmatter(text)
+    if header is None:
+        return None, text
+    return yaml.load(header, Loader=docs_frontmatter.safe_loader()) or {}, body
+
+
+def measure(func: Callable, inputs: List, repeat: int) -> float:
+    """Best-of-``repeat`` seconds for one pass over ``inputs``."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in inputs:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark front-matter parsing")
+    parser.add_argument("directory", nargs="?", default=str(ROOT / "docs"))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    paths = []
+    texts = []
+    for path in sorted(pathlib.Path(args.directory).rglob("*.md")):
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        if FRONTMATTER_RE.match(text):
+            paths.append(path)
+            texts.append(text)
+
+    if not texts:
+        print("No markdown files with front-matter found.")
+        sys.exit(1)
+
+    simple = 0
+    for text in texts:
+        header, _ = docs_frontmatter.split_frontmatter(text)
+        try:
+            docs_frontmatter.parse_simple(header)
+            simple += 1
+        except docs_frontmatter.UnsupportedHeaderError:
+            pass
+
+    print(f"Files: {len(texts)} ({simple} handled by the restricted parser)")
+    print(f"libyaml available: {docs_frontmatter.safe_loader() is not yaml.SafeLoader}")
+    print()
+
+    cases = [
+        ("regex + yaml.safe_load (baseline)", baseline, texts),
+        ("regex + CSafeLoader", csafe_only, texts),
+        (
+            "docs_frontmatter.extract_frontmatter",
+            docs_frontmatter.extract_frontmatter,
+            texts,
+        ),
+        (
+            "read_text + regex + yaml.safe_load",
+            lambda p: baseline(p.read_text(encoding="utf-8")),
+            paths,
+        ),
+        ("docs_frontmatter.read_frontmatter", docs_frontmatter.read_frontmatter, paths),
+    ]
+
+    reference = None
+    print(f"{'Case':<40} {'Total ms':>10} {'us/file':>10} {'Speedup':>8}")
+    print("-" * 71)
+    for name, func, inputs in cases:
+        seconds = measure(func, inputs, args.repeat)
+        if reference is None:
+            reference = seconds
+        print(
+            f"{name:<40} {seconds * 1000:>10.2f} "
+            f"{seconds / len(inputs) * 1e6:>10.1f} {reference / seconds:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
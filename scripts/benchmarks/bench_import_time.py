@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Startup time benchmark for the documentation tooling
+
+Times fresh interpreters importing the docs modules and running
+validate_docs.py when nothing changed since the cached run (the common
+pre-commit case), and lists which optional heavy dependencies each case
+ended up importing. The cost of importing all of them eagerly is shown
+for comparison.
+
+Usage:
+    python scripts/benchmarks/bench_import_time.py [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+SCRIPTS = ROOT / "scripts"
+
+HEAVY_MODULES = ["yaml", "simhash", "numpy", "rapidfuzz", "watchdog"]
+
+# Reports the heavy modules loaded by the time the interpreter exits
+REPORT = (
+    "import atexit, json, sys\n"
+    "atexit.register(lambda: print(json.dumps("
+    f"[m for m in {HEAVY_MODULES!r} if m in sys.modules]), file=sys.stderr))\n"
+)
+
+RUN_VALIDATOR = (
+    "import sys\n"
+    "import validate_docs\n"
+    "sys.argv = ['validate_docs.py', '--pre-commit']\n"
+    "try:\n"
+    "    validate_docs.main()\n"
+    "except SystemExit:\n"
+    "    pass\n"
+)
+
+CASES = [
+    ("interpreter startup", "pass"),
+    ("import docs_frontmatter", "import docs_frontmatter"),
+    ("import validate_docs", "import validate_docs"),
+    ("validate_docs --pre-commit (nothing changed)", RUN_VALIDATOR),
+    (
+        "eager optional imports",
+        "import yaml, simhash, numpy, rapidfuzz.fuzz, rapidfuzz.process",
+    ),
+]
+
+
+def run_case(code: str) -> Tuple[float, List[str]]:
+    """Wall seconds of a fresh interpreter running ``code``, and heavy imports."""
+    env = dict(os.environ, PYTHONPATH=str(SCRIPTS))
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", REPORT + code],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    seconds = time.perf_counter() - start
+    return seconds, json.loads(result.stderr.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark docs tooling startup")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    # Warm the registry cache so the validator run has nothing to do
+    run_case(RUN_VALIDATOR)
+
+    print(f"{'Case':<46} {'Median ms':>10} {'Min ms':>8}  Heavy imports")
+    print("-" * 90)
+    for name, code in CASES:
+        timings = []
+        modules: List[str] = []
+        for _ in range(args.repeat):
+            seconds, modules = run_case(code)
+            timings.append(seconds)
+        print(
+            f"{name:<46} {statistics.median(timings) * 1000:>10.1f} "
+            f"{min(timings) * 1000:>8.1f}  {', '.join(modules) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Shared-section detection for documents of very different sizes
+
+A short document pasted into a long one must still be reported: the
+chunk fingerprints sampled from the short document have to be sampled
+from the long one too, however many other chunks it has.
+
+Runs under pytest.
+"""
+
+import random
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+
+from docs_chunks import ChunkIndex, chunk_fingerprints
+from validate_docs import find_shared_sections, iter_tokens
+
+VOCABULARY = [f"word{i}" for i in range(2000)]
+
+
+def random_text(rng: random.Random, words: int) -> str:
+    lines = []
+    for _ in range(0, words, 12):
+        lines.append(" ".join(rng.choice(VOCABULARY) for _ in range(12)))
+    return "\n".join(lines)
+
+
+def entry(path: str, body: str) -> Dict[str, object]:
+    return {"path": path, "chunks": chunk_fingerprints(list(iter_tokens(body)))}
+
+
+def shared_reports(inbox: Dict[str, object], corpus: List[Dict]) -> List[str]:
+    index = ChunkIndex()
+    for position, corpus_entry in enumerate(corpus):
+        index.add(position, corpus_entry["chunks"])
+    return [
+        error.message
+        for error in find_shared_sections([inbox], index, dict(enumerate(corpus)))
+    ]
+
+
+def test_sample_does_not_depend_on_document_size():
+    rng = random.Random(0)
+    for _ in range(10):
+        section = random_text(rng, 600)
+        large = "\n\n".join([random_text(rng, 10000), section, random_text(rng, 10000)])
+        small_chunks = entry("small.md", section)["chunks"]
+        large_chunks = set(entry("large.md", large)["chunks"])
+        # Only the section's first and last chunks may be cut differently
+        # inside the large document; the ones between line up
+        assert len(set(small_chunks) - large_chunks) <= 2
+
+
+def test_small_document_inside_large_one_is_reported():
+    rng = random.Random(1)
+    for _ in range(10):
+        section = random_text(rng, 600)
+        large = "\n\n".join([random_text(rng, 10000), section, random_text(rng, 10000)])
+        inbox = entry("docs/_inbox/section.md", section)
+        corpus = [
+            entry("docs/guides/large.md", large),
+            entry("docs/guides/other.md", random_text(rng, 3000)),
+        ]
+        reports = shared_reports(inbox, corpus)
+        assert len(reports) == 1
+        assert "docs/guides/large.md" in reports[0]
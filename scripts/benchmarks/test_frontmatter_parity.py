@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Front-matter parser parity check against PyYAML
+
+docs_frontmatter.parse_simple() claims to return exactly what
+yaml.safe_load would for the headers it accepts (anything else raises
+UnsupportedHeaderError and falls back to PyYAML). This compares the two
+on known edge cases and on randomly generated headers built from the
+restricted grammar plus characters YAML treats specially.
+
+Runs under pytest, or standalone:
+    python scripts/benchmarks/test_frontmatter_parity.py [--cases N] [--seed S]
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from typing import Any, List, Optional
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+
+from docs_frontmatter import UnsupportedHeaderError, parse_simple
+
+# Headers PyYAML rejects or reads differently, which parse_simple must
+# hand over to it
+EDGE_CASES = [
+    "title: \tFoo",
+    "title: Foo\t",
+    "tags: \tnull",
+    "tags:\n- \t",
+    "tags:\n  - a\t",
+    "summary: >\n  line\t",
+    "title: a\x85b",
+    "title: a\u2028b",
+    "title: a\u2029b",
+    "title: a\rb",
+    "title: 'it''s'",
+    "created: 2024-02-30",
+    "count: 012",
+    "flag: yes",
+    "tags: [a, 'b, c', \"d\"]",
+    "tags: [faq?]",
+]
+
+KEYS = ["title", "tags", "doc_type", "status", "created", "summary", "owner"]
+
+# Scalar pieces: ordinary words, and the characters YAML treats specially
+WORDS = ["Foo", "bar baz", "null", "~", "yes", "Off", "true", "0", "42", "-7"]
+WORDS += ["012", "3.5", "2024-01-02", "2024-13-40", "'q'", "'it''s'", '"d"', "é"]
+SPECIAL = ["a: b", "x #y", "#z", '"e\\n"', "[", "]", ",", "{", "-", "- ", ">"]
+SPECIAL += ["|", "&a", "*a", "!t", "%", "@", "`", " ", "\t", "\r", "\x85", "\xa0"]
+SPECIAL += ["\u2028", "\u2029", "\ufeff", "?"]
+
+
+def random_scalar(rng: random.Random) -> str:
+    return "".join(
+        rng.choice(SPECIAL if rng.random() < 0.25 else WORDS)
+        for _ in range(rng.randint(1, 3))
+    )
+
+
+def random_value(rng: random.Random) -> str:
+    """The text after ``key:``, possibly followed by indented lines."""
+    kind = rng.randrange(6)
+    if kind == 0:
+        items = [random_scalar(rng) for _ in range(rng.randint(0, 3))]
+        return " [" + ", ".join(items) + "]"
+    if kind == 1:
+        indent = rng.choice(["", "  "])
+        items = [random_scalar(rng) for _ in range(rng.randint(1, 3))]
+        return "".join(f"\n{indent}- {item}" for item in items)
+    if kind == 2:
+        style = rng.choice([">", ">-", "|", "|-"])
+        lines = [random_scalar(rng) for _ in range(rng.randint(1, 3))]
+        return f" {style}" + "".join(f"\n  {line}" for line in lines)
+    if kind == 3:
+        pairs = [(rng.choice(KEYS), random_scalar(rng)) for _ in range(2)]
+        return "".join(f"\n  {key}: {value}" for key, value in pairs)
+    return rng.choice([" ", ""]) + random_scalar(rng)
+
+
+def random_header(rng: random.Random) -> str:
+    lines = [
+        f"{key}:{random_value(rng)}"
+        for key in rng.sample(KEYS, rng.randint(1, len(KEYS)))
+    ]
+    return "\n".join(lines)
+
+
+def same(a: Any, b: Any) -> bool:
+    """Equal values of equal types (True == 1 and str vs date don't count)."""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(same(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def mismatch(header: str) -> Optional[str]:
+    """Describe how parse_simple disagrees with PyYAML on ``header``, if it does."""
+    try:
+        simple = parse_simple(header)
+    except UnsupportedHeaderError:
+        return None
+    try:
+        expected = yaml.safe_load(header) or {}
+    except yaml.YAMLError as e:
+        return f"accepted, but PyYAML rejects it: {str(e).splitlines()[0]}"
+    if not same(simple, expected):
+        return f"{simple!r} != PyYAML {expected!r}"
+    return None
+
+
+def find_mismatches(cases: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    headers = EDGE_CASES + [random_header(rng) for _ in range(cases)]
+    found = []
+    for header in headers:
+        problem = mismatch(header)
+        if problem:
+            found.append(f"{header!r}: {problem}")
+    return found
+
+
+def test_edge_cases():
+    problems = [f"{h!r}: {mismatch(h)}" for h in EDGE_CASES if mismatch(h)]
+    assert not problems, "\n".join(problems)
+
+
+def test_random_headers():
+    problems = find_mismatches(cases=20000, seed=0)
+    assert not problems, "\n".join(problems[:20])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare docs_frontmatter.parse_simple with PyYAML"
+    )
+    parser.add_argument("--cases", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    problems = find_mismatches(args.cases, args.seed)
+    for problem in problems[:20]:
+        print(problem)
+    print(f"{len(problems)} mismatch(es) in {args.cases + len(EDGE_CASES)} headers")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Content-defined chunk fingerprints for partial-duplicate detection.
+
+A document-wide SimHash changes a lot when one section of a document is
+pasted into another, so scripts/validate_docs.py also fingerprints
+sections:
+
+- the word tokens of a body are cut into chunks where a rolling (gear)
+  hash of the last few tokens hits a boundary pattern, so boundaries
+  depend on local content only and line up again right after an edit
+- each chunk is hashed with blake2b (8 bytes, hex)
+- only fingerprints divisible by CHUNK_SAMPLE_MODULUS are kept. The
+  choice depends on the chunk alone, not on the rest of the document, so
+  a section kept in one document is kept in every document containing
+  it, however large; entries hold about one fingerprint per
+  CHUNK_SAMPLE_MODULUS chunks.
+
+ChunkIndex maps fingerprints to the documents holding them, so shared
+sections are found by lookups instead of comparing document pairs.
+"""
+
+import functools
+import hashlib
+import zlib
+from collections import Counter
+from typing import Dict, Hashable, Iterable, Iterator, List, Sequence, Set
+
+# Chunk length limits in tokens; the mask sets the average length past the
+# minimum to about 16 tokens
+CHUNK_MIN_TOKENS = 16
+CHUNK_MAX_TOKENS = 128
+CHUNK_MASK = (1 << 4) - 1
+
+# Tokens the boundary test depends on
+_WINDOW = CHUNK_MASK.bit_length()
+
+# One in this many distinct chunk fingerprints is kept
+CHUNK_SAMPLE_MODULUS = 4
+
+# Fingerprints held by more documents than this are treated as boilerplate
+# (templates, standard sections) and not reported
+CHUNK_MAX_DOCS = 8
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _gear(token: str) -> int:
+    """Pseudo-random 32-bit value of a token for the rolling hash."""
+    return zlib.crc32(token.encode("utf-8"))
+
+
+def iter_chunks(tokens: Sequence[str]) -> Iterator[Sequence[str]]:
+    """Split ``tokens`` at content-defined boundaries.
+
+    A chunk ends at the first token, once it is CHUNK_MIN_TOKENS long, where
+    the rolling hash has no CHUNK_MASK bits set, or at CHUNK_MAX_TOKENS. A
+    trailing run shorter than CHUNK_MIN_TOKENS is dropped, so short
+    documents have no chunks.
+    """
+    gears = list(map(_gear, tokens))
+    start = 0
+    while len(tokens) - start >= CHUNK_MIN_TOKENS:
+        first = start + CHUNK_MIN_TOKENS - 1
+        end = min(start + CHUNK_MAX_TOKENS, len(tokens))
+
+        # Each step shifts a token's value left, so the masked low bits
+        # only depend on the last _WINDOW tokens: the hash is primed there
+        # instead of rolling over the whole chunk
+        rolling = 0
+        for gear in gears[first - _WINDOW + 1 : first]:
+            rolling = ((rolling << 1) + gear) & CHUNK_MASK
+
+        last = end - 1
+        for position in range(first, end):
+            rolling = ((rolling << 1) + gears[position]) & CHUNK_MASK
+            if not rolling:
+                last = position
+                break
+
+        yield tokens[start : last + 1]
+        start = last + 1
+
+
+def chunk_fingerprints(
+    tokens: Sequence[str], modulus: int = CHUNK_SAMPLE_MODULUS
+) -> List[str]:
+    """Distinct chunk fingerprints of ``tokens`` divisible by ``modulus``, sorted."""
+    fingerprints = {
+        hashlib.blake2b(" ".join(chunk).encode("utf-8"), digest_size=8).hexdigest()
+        for chunk in iter_chunks(tokens)
+    }
+    return sorted(f for f in fingerprints if int(f, 16) % modulus == 0)
+
+
+class ChunkIndex:
+    """Fingerprint -> document postings for finding shared sections."""
+
+    def __init__(self):
+        self.postings: Dict[str, Set[Hashable]] = {}
+        self.fingerprints: Dict[Hashable, List[str]] = {}
+
+    def add(self, key: Hashable, fingerprints: Iterable[str]) -> None:
+        """Index a document's fingerprints, replacing any under the same key."""
+        self.remove(key)
+        fingerprints = list(fingerprints)
+        if not fingerprints:
+            return
+        self.fingerprints[key] = fingerprints
+        for fingerprint in fingerprints:
+            self.postings.setdefault(fingerprint, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        for fingerprint in self.fingerprints.pop(key, ()):
+            keys = self.postings[fingerprint]
+            keys.discard(key)
+            if not keys:
+                del self.postings[fingerprint]
+
+    def shared(
+        self, fingerprints: Iterable[str], max_docs: int = CHUNK_MAX_DOCS
+    ) -> Counter:
+        """Count, per indexed document, the fingerprints it shares.
+
+        Fingerprints held by more than ``max_docs`` documents are ignored.
+        """
+        counts: Counter = Counter()
+        for fingerprint in fingerprints:
+            keys = self.postings.get(fingerprint, ())
+            if len(keys) <= max_docs:
+                counts.update(keys)
+        return counts
@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+Shared YAML front-matter parsing for the documentation tooling.
+
+Used by scripts/validate_docs.py and git-hooks/checks/python/organize_docs.py.
+
+Front-matter headers in docs/ follow a flat schema (see REQUIRED_FIELDS in
+validate_docs.py): scalar keys, flow or block lists of scalars, folded
+summaries and the occasional one-level mapping. Those are handled by a
+small restricted parser that returns exactly what yaml.safe_load would
+(checked by scripts/benchmarks/test_frontmatter_parity.py). Anything
+outside that subset, including tabs and Unicode line breaks, falls back
+to PyYAML, using the libyaml CSafeLoader when it is available. PyYAML is
+only imported for such headers, so most runs never load it.
+
+MarkdownDocument reads files header-first and loads bodies on demand;
+file_sha256() hashes content without decoding it.
+"""
+
+import datetime
+import functools
+import hashlib
+import mmap
+import pathlib
+import re
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+FRONTMATTER_RE = re.compile(r"^---\r?\n(.*?)\r?\n---\r?\n", re.S)
+
+# Header bytes read line by line; past this, the closing line is searched
+# for in the rest of the file read at once
+MAX_HEADER_BYTES = 64 * 1024
+
+# Closing ``---`` line of a header, at the start of any line
+_CLOSING_LINE_RE = re.compile(rb"^---\r?\n", re.M)
+
+# Read size when hashing files that need newline translation
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+class UnsupportedHeaderError(Exception):
+    """Raised when a header falls outside the restricted grammar."""
+
+
+class FrontMatterError(ValueError):
+    """Raised for malformed YAML, or when a header needs missing PyYAML."""
+
+
+# Exceptions that mean "this header can't be parsed"
+PARSE_ERRORS = (FrontMatterError,)
+
+
+@functools.lru_cache(maxsize=None)
+def load_yaml() -> Any:
+    """Import PyYAML on first use; None if it is not installed."""
+    try:
+        import yaml
+    except ImportError:
+        return None
+    return yaml
+
+
+def safe_loader() -> Any:
+    """PyYAML's fastest safe loader (the libyaml one if available)."""
+    yaml = load_yaml()
+    return yaml and getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+_KEY_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_-]*):(?: +(.*))?$")
+_INT_RE = re.compile(r"[-+]?(?:0|[1-9][0-9]*)$")
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})$")
+# Characters left to PyYAML: non-printables, tabs (separation whitespace
+# YAML treats differently from spaces) and the line breaks NEL, LS and PS.
+# Only "\r\n" line ends are allowed a carriage return (see parse_simple).
+_UNSUPPORTED_CHAR_RE = re.compile(
+    "[^\x0a\x0d\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+
+# Plain scalars YAML 1.1 resolves to null or bool
+_NULLS = {"", "~", "null", "Null", "NULL"}
+_BOOLS = {
+    **dict.fromkeys(("yes", "Yes", "YES", "true", "True", "TRUE"), True),
+    **dict.fromkeys(("on", "On", "ON"), True),
+    **dict.fromkeys(("no", "No", "NO", "false", "False", "FALSE"), False),
+    **dict.fromkeys(("off", "Off", "OFF"), False),
+}
+
+_BLOCK_STYLES = (">", ">-", "|", "|-")
+
+# Characters that may start something other than a plain string
+_INDICATORS = set("-?:,[]{}#&*!|>'\"%@`=~<+.0123456789")
+
+
+def _plain(value: str, flow: bool = False) -> Any:
+    """Resolve a plain scalar the way SafeLoader does, or give up."""
+    if value in _NULLS:
+        return None
+    if value in _BOOLS:
+        return _BOOLS[value]
+    if _INT_RE.match(value):
+        return int(value)
+    date = _DATE_RE.match(value)
+    if date:
+        try:
+            return datetime.date(*(int(part) for part in date.groups()))
+        except ValueError:
+            # Let YAML report it
+            raise UnsupportedHeaderError(value) from None
+    if (
+        value[0] in _INDICATORS
+        or ": " in value
+        or " #" in value
+        or value.endswith(":")
+        or (flow and any(c in value for c in ",?[]{}"))
+    ):
+        raise UnsupportedHeaderError(value)
+    return value
+
+
+def _scalar(value: str, flow: bool = False) -> Any:
+    """Parse a single-line scalar: plain, single- or double-quoted."""
+    if value[:1] == '"':
+        if len(value) < 2 or not value.endswith('"'):
+            raise UnsupportedHeaderError(value)
+        inner = value[1:-1]
+        if '"' in inner or "\\" in inner:
+            raise UnsupportedHeaderError(value)
+        return inner
+    if value[:1] == "'":
+        if len(value) < 2 or not value.endswith("'"):
+            raise UnsupportedHeaderError(value)
+        inner = value[1:-1]
+        if "'" in inner.replace("''", ""):
+            raise UnsupportedHeaderError(value)
+        return inner.replace("''", "'")
+    return _plain(value, flow)
+
+
+def _flow_list(value: str) -> List[Any]:
+    """Parse ``[a, b, c]`` with scalar items."""
+    inner = value[1:-1].strip(" ")
+    if not inner:
+        return []
+    if any(c in inner for c in "'\"") and any(c in inner for c in "[]{}"):
+        raise UnsupportedHeaderError(value)
+
+    items = []
+    for raw in _split_flow(inner):
+        item = raw.strip(" ")
+        if not item:
+            raise UnsupportedHeaderError(value)
+        items.append(_scalar(item, flow=True))
+    return items
+
+
+def _split_flow(inner: str) -> List[str]:
+    """Split flow items on commas outside quotes."""
+    parts = []
+    start = 0
+    quote = ""
+    for i, c in enumerate(inner):
+        if quote:
+            if c == quote:
+                quote = ""
+        elif c in "'\"":
+            quote = c
+        elif c == ",":
+            parts.append(inner[start:i])
+            start = i + 1
+    if quote:
+        raise UnsupportedHeaderError(inner)
+    parts.append(inner[start:])
+    return parts
+
+
+def _block_scalar(style: str, lines: List[str], last: bool) -> str:
+    """Parse a simple ``>`` / ``|`` block (single indent, no blank lines).
+
+    ``last`` marks a block that ends the header: with no line break after
+    it, clip chomping leaves no trailing newline.
+    """
+    if not lines:
+        raise UnsupportedHeaderError(style)
+    indent = len(lines[0]) - len(lines[0].lstrip(" "))
+    stripped = []
+    for line in lines:
+        text = line[indent:]
+        if (
+            not text
+            or line[:indent].strip(" ")
+            or text[0] in " #"
+            or text != text.rstrip(" ")
+        ):
+            raise UnsupportedHeaderError(line)
+        stripped.append(text)
+
+    text = (" " if style[0] == ">" else "\n").join(stripped)
+    return text if last or style.endswith("-") else text + "\n"
+
+
+def _parse_value(value: str, nested: List[str], last: bool) -> Any:
+    """Parse the value of a top-level key plus its indented lines."""
+    if value in _BLOCK_STYLES:
+        return _block_scalar(value, nested, last)
+    if nested:
+        if value:
+            raise UnsupportedHeaderError(value)
+        return _parse_nested(nested)
+    if value.startswith("["):
+        if not value.endswith("]"):
+            raise UnsupportedHeaderError(value)
+        return _flow_list(value)
+    return _scalar(value)
+
+
+def _parse_nested(lines: List[str]) -> Any:
+    """Parse a block list of scalars or a one-level mapping of scalars."""
+    indent = len(lines[0]) - len(lines[0].lstrip(" "))
+    if any(len(line) - len(line.lstrip(" ")) != indent for line in lines):
+        raise UnsupportedHeaderError(lines[0])
+
+    body = [line[indent:] for line in lines]
+    if all(line.startswith("- ") for line in body):
+        return [_scalar(line[2:].strip(" ")) for line in body]
+
+    mapping: Dict[str, Any] = {}
+    for line in body:
+        match = _KEY_RE.match(line.rstrip(" "))
+        if not match or match.group(1) in _NULLS or match.group(1) in _BOOLS:
+            raise UnsupportedHeaderError(line)
+        value = (match.group(2) or "").strip(" ")
+        if value.startswith(("[", ">", "|")):
+            raise UnsupportedHeaderError(line)
+        mapping[match.group(1)] = _scalar(value) if value else None
+    return mapping
+
+
+def parse_simple(header: str) -> Dict[str, Any]:
+    """Parse a flat front-matter header without PyYAML.
+
+    Raises UnsupportedHeaderError if the header uses anything outside the restricted
+    grammar, in which case the caller should fall back to YAML.
+    """
+    # A lone carriage return is a line break to YAML. With tabs excluded,
+    # whitespace below is only ever stripped as spaces, like YAML does.
+    if _UNSUPPORTED_CHAR_RE.search(header) or "\r" in header.replace("\r\n", ""):
+        raise UnsupportedHeaderError(header)
+
+    meta: Dict[str, Any] = {}
+    key: Optional[str] = None
+    value = ""
+    nested: List[str] = []
+
+    def flush(last=False):
+        if key is not None:
+            meta[key] = _parse_value(value, nested, last)
+
+    for line in header.split("\n"):
+        line = line.rstrip("\r")
+        if not line.strip(" ") or line[0] == "#":
+            if nested or value in _BLOCK_STYLES:
+                raise UnsupportedHeaderError(line)
+            continue
+        if line[0] == " ":
+            # Block list items may sit at column zero too
+            if key is None:
+                raise UnsupportedHeaderError(line)
+            nested.append(line)
+            continue
+        if line.startswith("- ") and key is not None and not value:
+            nested.append(line)
+            continue
+
+        flush()
+        match = _KEY_RE.match(line.rstrip(" "))
+        if not match or match.group(1) in _NULLS or match.group(1) in _BOOLS:
+            raise UnsupportedHeaderError(line)
+        key = match.group(1)
+        value = (match.group(2) or "").strip(" ")
+        nested = []
+
+    flush(last=True)
+    return meta
+
+
+def parse_frontmatter(header: str) -> Dict[str, Any]:
+    """Parse a front-matter header into a dict.
+
+    Raises one of PARSE_ERRORS for malformed YAML, or if the header needs
+    PyYAML but it is not installed.
+    """
+    try:
+        return parse_simple(header)
+    except UnsupportedHeaderError:
+        pass
+
+    yaml = load_yaml()
+    if yaml is None:
+        raise FrontMatterError("PyYAML not installed. Run: pip install pyyaml")
+    try:
+        return yaml.load(header, Loader=safe_loader()) or {}
+    except yaml.YAMLError as e:
+        raise FrontMatterError(str(e)) from e
+
+
+def split_frontmatter(text: str) -> Tuple[Optional[str], str]:
+    """Split markdown into its raw front-matter header and body."""
+    match = FRONTMATTER_RE.match(text)
+    if not match:
+        return None, text
+    return match.group(1), text[match.end() :]
+
+
+def extract_frontmatter(text: str) -> Tuple[Optional[Dict], str]:
+    """Extract YAML front-matter and body from markdown.
+
+    Returns ``(None, text)`` without front-matter, and
+    ``({"_parse_error": ...}, text)`` if the header cannot be parsed.
+    """
+    header, body = split_frontmatter(text)
+    if header is None:
+        return None, text
+
+    try:
+        return parse_frontmatter(header), body
+    except PARSE_ERRORS as e:
+        return {"_parse_error": str(e)}, text
+
+
+def _scan_header(f: BinaryIO) -> Tuple[bool, Optional[str], int]:
+    """Read a front-matter header from the start of a binary file.
+
+    Returns whether the file is empty, the decoded header (None without
+    front-matter) and the byte offset at which the body starts.
+    """
+    first = f.readline()
+    if first not in (b"---\n", b"---\r\n"):
+        return not first, None, 0
+
+    lines: List[bytes] = []
+    size = len(first)
+    while size <= MAX_HEADER_BYTES:
+        line = f.readline()
+        if not line:
+            return False, None, 0
+        size += len(line)
+        if lines and line in (b"---\n", b"---\r\n"):
+            return False, _header_text(b"".join(lines)), size
+        lines.append(line)
+
+    # An unusually long header, or a leading rule that is never closed
+    rest = f.read()
+    match = _CLOSING_LINE_RE.search(rest)
+    if not match:
+        return False, None, 0
+    header = b"".join(lines) + rest[: match.start()]
+    return False, _header_text(header), size + match.end()
+
+
+def _header_text(header: bytes) -> str:
+    """Decode header lines, without the newline before the closing ``---``."""
+    header = header[:-2] if header.endswith(b"\r\n") else header[:-1]
+    return header.decode("utf-8")
+
+
+def read_header(path: pathlib.Path) -> Optional[str]:
+    """Read only the front-matter header of a file, without the body.
+
+    Stops at the closing ``---`` line; returns None if the file has no
+    front-matter.
+    """
+    with open(path, "rb") as f:
+        return _scan_header(f)[1]
+
+
+def _parse_header(header: Optional[str]) -> Optional[Dict]:
+    if header is None:
+        return None
+
+    try:
+        return parse_frontmatter(header)
+    except PARSE_ERRORS as e:
+        return {"_parse_error": str(e)}
+
+
+def read_frontmatter(path: pathlib.Path) -> Optional[Dict]:
+    """Read and parse a file's front-matter without loading the body.
+
+    Same return convention as extract_frontmatter() for the metadata.
+    """
+    return _parse_header(read_header(path))
+
+
+class MarkdownDocument:
+    """A markdown file read header-first, with the body loaded on demand.
+
+    Opening a document reads only up to the closing ``---`` of its
+    front-matter. The full text is read on first access to ``text`` or
+    ``body``, so callers that only need metadata never load large bodies.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.empty, self.header, self.body_offset = _scan_header(f)
+        self._text: Optional[str] = None
+        self._frontmatter: Optional[Dict] = None
+        self._sha256: Optional[str] = None
+
+    @property
+    def has_frontmatter(self) -> bool:
+        return self.header is not None
+
+    @property
+    def frontmatter(self) -> Optional[Dict]:
+        """Parsed front-matter, same convention as read_frontmatter()."""
+        if self._frontmatter is None:
+            self._frontmatter = _parse_header(self.header)
+        return self._frontmatter
+
+    @property
+    def text(self) -> str:
+        """Full file content (read on first access)."""
+        if self._text is None:
+            self._text = self.path.read_text(encoding="utf-8")
+        return self._text
+
+    @property
+    def body(self) -> str:
+        """Content after the front-matter (the whole text without it).
+
+        Read straight from the body offset unless the text is loaded.
+        """
+        if self._text is not None:
+            return split_frontmatter(self._text)[1]
+        with open(self.path, "rb") as f:
+            f.seek(self.body_offset)
+            return _decode(f.read())
+
+    def sha256(self) -> str:
+        """SHA256 of the file content, as file_sha256() (computed once)."""
+        if self._sha256 is None:
+            self._sha256 = file_sha256(self.path)
+        return self._sha256
+
+
+def _decode(data: bytes) -> str:
+    """Decode like read_text(): strict UTF-8 with universal newlines."""
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _normalized_chunks(f: BinaryIO) -> Iterator[bytes]:
+    """Yield file bytes with CRLF and CR translated to LF."""
+    pending = b""
+    while True:
+        chunk = f.read(HASH_CHUNK_BYTES)
+        if not chunk:
+            break
+        chunk = pending + chunk
+        # A trailing CR may be the first half of a CRLF split across reads
+        if chunk.endswith(b"\r"):
+            chunk, pending = chunk[:-1], b"\r"
+        else:
+            pending = b""
+        yield chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    if pending:
+        yield b"\n"
+
+
+def file_sha256(path: pathlib.Path) -> str:
+    """Hash a file's bytes without decoding them.
+
+    Produces the same digest as hashing ``path.read_text().encode()`` (the
+    registry's ``sha256``), but reads through an mmap so large documents
+    are never copied into a str. Files with CR line endings are hashed in
+    chunks with newlines translated, as text mode would.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            return digest.hexdigest()
+
+        with mapped:
+            if mapped.find(b"\r") == -1:
+                digest.update(mapped)
+                return digest.hexdigest()
+
+        for chunk in _normalized_chunks(f):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of parsed documents, shared by the documentation tools.
+
+The pre-commit flow runs git-hooks/checks/python/organize_docs.py and
+then scripts/validate_docs.py over the same files. Both open documents
+through ParseCache, so a header parsed by one is not parsed again by the
+other (or by the next run):
+
+    from docs_parse_cache import ParseCache
+
+    cache = ParseCache(ROOT / "docs" / "index" / ".parse-cache.json", ROOT)
+    document = cache.open(path)  # a docs_frontmatter.MarkdownDocument
+    ...
+    cache.save()
+
+The cache holds two tables:
+
+- per path: mtime, size, content hash (as docs_frontmatter.file_sha256),
+  body offset and whether the file is empty. A file whose mtime and size
+  are unchanged is served from here without being opened.
+- per content hash: whether there is front-matter, and the parsed
+  front-matter. A file that was touched, moved or renamed but not
+  edited is hashed, and its header is not parsed again.
+
+Bodies are never cached; they are read from disk when needed. The cache
+file is only loaded once a document is opened, so runs that open none
+don't pay for it.
+"""
+
+import datetime
+import hashlib
+import importlib.util
+import json
+import os
+import pathlib
+from typing import Any, Dict, Optional, Set, Tuple
+
+import docs_frontmatter
+from docs_frontmatter import MarkdownDocument
+
+# Bump when the record layout changes
+PARSE_CACHE_VERSION = 1
+
+
+def _encode_value(value: Any) -> Any:
+    # Front-matter values YAML produces that JSON can't hold
+    if isinstance(value, datetime.datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"$date": value.isoformat()}
+    raise TypeError(f"Unsupported front-matter value: {value!r}")
+
+
+def _decode_object(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        if "$date" in obj:
+            return datetime.date.fromisoformat(obj["$date"])
+        if "$datetime" in obj:
+            return datetime.datetime.fromisoformat(obj["$datetime"])
+    return obj
+
+
+def encode_frontmatter(meta: Optional[Dict]) -> Optional[str]:
+    """Serialize parsed front-matter, or None if it wouldn't round-trip."""
+    try:
+        encoded = json.dumps(meta, ensure_ascii=False, default=_encode_value)
+    except (TypeError, ValueError):
+        return None
+    # e.g. non-string keys come back as strings
+    if decode_frontmatter(encoded) != meta:
+        return None
+    return encoded
+
+
+def decode_frontmatter(encoded: str) -> Optional[Dict]:
+    return json.loads(encoded, object_hook=_decode_object)
+
+
+class CachedDocument(MarkdownDocument):
+    """A MarkdownDocument restored from the parse cache.
+
+    Metadata and hash come from the cache; the file is only read if the
+    text or body is used.
+    """
+
+    def __init__(
+        self, path: pathlib.Path, record: Dict[str, Any], content: Dict[str, Any]
+    ):
+        self.path = path
+        self.empty = record["empty"]
+        self.header = None
+        self.body_offset = record["body_offset"]
+        self._has_frontmatter = content["has_frontmatter"]
+        self._text = None
+        self._frontmatter = decode_frontmatter(content["frontmatter"])
+        self._sha256 = record["sha256"]
+
+    @property
+    def has_frontmatter(self) -> bool:
+        return self._has_frontmatter
+
+
+class ParseCache:
+    """Parsed documents keyed by path (mtime and size) and content hash."""
+
+    def __init__(self, path: pathlib.Path, root: pathlib.Path):
+        self.path = path
+        self.root = root
+        self._root_prefix = os.path.join(str(root), "")
+        self.paths: Dict[str, Dict[str, Any]] = {}
+        self.contents: Dict[str, Dict[str, Any]] = {}
+        self.loaded = False
+        self.dirty = False
+        # Documents parsed this run, stored on save()
+        self.pending: Dict[str, Tuple[MarkdownDocument, os.stat_result]] = {}
+
+    @staticmethod
+    def fingerprint() -> str:
+        """Identify the parser build that produced the cached records."""
+        digest = hashlib.sha256(pathlib.Path(docs_frontmatter.__file__).read_bytes())
+        has_yaml = importlib.util.find_spec("yaml") is not None
+        digest.update(f"yaml={has_yaml}".encode())
+        return digest.hexdigest()
+
+    def load(self) -> None:
+        """Load cached records, discarding them if stale or unreadable."""
+        self.loaded = True
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if (
+            data.get("version") == PARSE_CACHE_VERSION
+            and data.get("fingerprint") == self.fingerprint()
+        ):
+            self.paths = data.get("paths", {})
+            self.contents = data.get("contents", {})
+
+    def _rel(self, path: pathlib.Path) -> str:
+        # String prefix instead of Path.relative_to, which is slow per file
+        text = str(path)
+        if not text.startswith(self._root_prefix):
+            text = str(path.relative_to(self.root))
+        else:
+            text = text[len(self._root_prefix) :]
+        return text.replace("\\", "/")
+
+    def open(self, path: pathlib.Path) -> MarkdownDocument:
+        """Open ``path`` as a MarkdownDocument, from the cache if possible.
+
+        Raises OSError (or UnicodeDecodeError for a bad header) like
+        MarkdownDocument itself.
+        """
+        if not self.loaded:
+            self.load()
+
+        rel_path = self._rel(path)
+        st = path.stat()
+        record = self.paths.get(rel_path)
+        if (
+            record
+            and record["mtime_ns"] == st.st_mtime_ns
+            and record["size"] == st.st_size
+            and record["sha256"] in self.contents
+        ):
+            return CachedDocument(path, record, self.contents[record["sha256"]])
+
+        document = MarkdownDocument(path)
+        self.pending[rel_path] = (document, st)
+        content = self.contents.get(document.sha256())
+        if content and content["has_frontmatter"] == document.has_frontmatter:
+            # Same content seen under another path or mtime
+            return CachedDocument(path, self._path_record(document, st), content)
+        return document
+
+    @staticmethod
+    def _path_record(document: MarkdownDocument, st: os.stat_result) -> Dict:
+        return {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "sha256": document.sha256(),
+            "body_offset": document.body_offset,
+            "empty": document.empty,
+        }
+
+    def prune(self, seen: Set[str]) -> None:
+        """Drop records of deleted files.
+
+        ``seen`` holds the paths a full scan found, which are known to
+        exist; only other records are checked on disk.
+        """
+        if not self.loaded:
+            self.load()
+        for rel_path in list(self.paths):
+            if rel_path not in seen and not (self.root / rel_path).exists():
+                del self.paths[rel_path]
+                self.dirty = True
+
+    def save(self) -> None:
+        """Record documents parsed this run and write the cache if changed."""
+        for rel_path, (document, st) in self.pending.items():
+            sha256 = document.sha256()
+            if sha256 not in self.contents:
+                encoded = encode_frontmatter(document.frontmatter)
+                if encoded is None:
+                    continue
+                self.contents[sha256] = {
+                    "has_frontmatter": document.has_frontmatter,
+                    "frontmatter": encoded,
+                }
+            self.paths[rel_path] = self._path_record(document, st)
+            self.dirty = True
+        self.pending.clear()
+        if not self.dirty:
+            return
+
+        # Contents no path refers to any more
+        referenced = {record["sha256"] for record in self.paths.values()}
+        self.contents = {
+            sha256: content
+            for sha256, content in self.contents.items()
+            if sha256 in referenced
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": PARSE_CACHE_VERSION,
+            "fingerprint": self.fingerprint(),
+            "paths": self.paths,
+            "contents": self.contents,
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+        self.dirty = False
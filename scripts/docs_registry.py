@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Indexed SQLite copy of the documentation registry.
+
+scripts/validate_docs.py --sqlite writes docs/index/registry.sqlite next to
+registry.json. It holds the same entries, with indexes on doc_id, status,
+doc_type and tags, so tools can answer lookups without loading and scanning
+the whole JSON file:
+
+    from docs_registry import RegistryDB
+
+    with RegistryDB() as registry:
+        registry.by_doc_id("DOC-2025-00042")
+        registry.by_tag("plugins")
+        registry.by_status("active")
+
+Entries are returned as the same dicts registry.json contains, newest first.
+"""
+
+import json
+import os
+import pathlib
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+REGISTRY_DB = ROOT / "docs" / "index" / "registry.sqlite"
+
+# Bump when the table layout changes
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE docs (
+    position INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    doc_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    canonical INTEGER NOT NULL,
+    created TEXT NOT NULL,
+    entry TEXT NOT NULL
+);
+CREATE TABLE tags (tag TEXT NOT NULL, position INTEGER NOT NULL);
+CREATE INDEX docs_path ON docs (path);
+CREATE INDEX docs_doc_id ON docs (doc_id);
+CREATE INDEX docs_status ON docs (status);
+CREATE INDEX docs_doc_type ON docs (doc_type);
+CREATE INDEX tags_tag ON tags (tag, position);
+"""
+
+
+def write_registry_db(
+    registry: Dict[str, Any], path: pathlib.Path = REGISTRY_DB
+) -> None:
+    """Write ``registry`` (the registry.json payload) to an SQLite file.
+
+    The database is built under a temporary name and moved into place, so
+    readers never see a partial file.
+    """
+    tmp_path = path.with_suffix(".sqlite.tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(str(tmp_path))
+    try:
+        conn.executescript(SCHEMA)
+        conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            [
+                ("schema_version", str(SCHEMA_VERSION)),
+                ("generated_at", str(registry.get("generated_at", ""))),
+                ("total_docs", str(registry.get("total_docs", 0))),
+            ],
+        )
+
+        docs = registry.get("docs", [])
+        conn.executemany(
+            "INSERT INTO docs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    position,
+                    entry["path"],
+                    str(entry.get("doc_id", "")),
+                    str(entry.get("doc_type", "")),
+                    str(entry.get("status", "")),
+                    int(bool(entry.get("canonical"))),
+                    str(entry.get("created", "")),
+                    json.dumps(entry, ensure_ascii=False, default=str),
+                )
+                for position, entry in enumerate(docs)
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO tags VALUES (?, ?)",
+            [
+                (str(tag), position)
+                for position, entry in enumerate(docs)
+                if isinstance(entry.get("tags"), list)
+                for tag in set(map(str, entry["tags"]))
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, path)
+
+
+def registry_db_generated_at(path: pathlib.Path = REGISTRY_DB) -> Optional[str]:
+    """generated_at of the registry an SQLite file was written from.
+
+    None if the file is missing, unreadable or has another schema version,
+    i.e. whenever it has to be written again.
+    """
+    if not path.exists():
+        return None
+    try:
+        conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+    if meta.get("schema_version") != str(SCHEMA_VERSION):
+        return None
+    return meta.get("generated_at")
+
+
+class RegistryDB:
+    """Read-only lookups against registry.sqlite."""
+
+    def __init__(self, path: pathlib.Path = REGISTRY_DB):
+        if not path.exists():
+            raise FileNotFoundError(
+                f"{path} not found. Generate it with: python scripts/validate_docs.py --sqlite"
+            )
+        self.conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+
+        version = self.meta().get("schema_version")
+        if version != str(SCHEMA_VERSION):
+            self.conn.close()
+            raise ValueError(
+                f"{path} has schema version {version}, expected {SCHEMA_VERSION}. "
+                "Regenerate it with: python scripts/validate_docs.py --sqlite"
+            )
+
+    def __enter__(self) -> "RegistryDB":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def meta(self) -> Dict[str, str]:
+        """generated_at, total_docs and schema_version of the registry."""
+        return dict(self.conn.execute("SELECT key, value FROM meta"))
+
+    def _entries(self, sql: str, *params: Any) -> List[Dict[str, Any]]:
+        return [json.loads(row[0]) for row in self.conn.execute(sql, params)]
+
+    def by_path(self, path: str) -> Optional[Dict[str, Any]]:
+        entries = self._entries("SELECT entry FROM docs WHERE path = ?", path)
+        return entries[0] if entries else None
+
+    def by_doc_id(self, doc_id: str) -> List[Dict[str, Any]]:
+        # doc_ids are not guaranteed unique, so every match is returned
+        return self._entries(
+            "SELECT entry FROM docs WHERE doc_id = ? ORDER BY position", doc_id
+        )
+
+    def by_tag(self, tag: str) -> List[Dict[str, Any]]:
+        return self._entries(
+            "SELECT d.entry FROM tags t JOIN docs d ON d.position = t.position "
+            "WHERE t.tag = ? ORDER BY t.position",
+            tag,
+        )
+
+    def by_status(self, status: str) -> List[Dict[str, Any]]:
+        return self._entries(
+            "SELECT entry FROM docs WHERE status = ? ORDER BY position", status
+        )
+
+    def by_doc_type(self, doc_type: str) -> List[Dict[str, Any]]:
+        return self._entries(
+            "SELECT entry FROM docs WHERE doc_type = ? ORDER BY position", doc_type
+        )
+
+    def canonical(self) -> List[Dict[str, Any]]:
+        return self._entries(
+            "SELECT entry FROM docs WHERE canonical = 1 ORDER BY position"
+        )
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Batch SimHash engine for the documentation registry.
+
+Computes the same 64-bit fingerprints as ``simhash.Simhash(text).value``
+(the ``simhash`` values stored in docs/index/registry.json), but for many
+documents at once:
+
+- features are the 4-character shingles Simhash uses, counted per document
+- each distinct feature is hashed once for the whole corpus (md5, low
+  64 bits, as Simhash does)
+- per-bit weighted sums for every document in a batch are computed with
+  NumPy over a single feature-occurrence array
+
+Requires NumPy (a dependency of the ``simhash`` package).
+"""
+
+import hashlib
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+SIMHASH_BITS = 64
+
+# Simhash's default token pattern and shingle width
+FEATURE_RE = re.compile(r"[\w\u4e00-\u9fcc]+")
+FEATURE_WIDTH = 4
+
+# Documents per vectorized batch; bounds the size of the occurrence arrays
+BATCH_DOCS = 1024
+
+
+# Bits per character in a packed shingle key (FEATURE_WIDTH of them fit
+# in a uint64)
+_KEY_BITS = 16
+
+# Feature rows of one document summed at a time
+_ROW_BLOCK = 1 << 16
+
+# (document index, feature hash, weight) arrays
+_Rows = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def simhash_features(text: str) -> Counter:
+    """Count Simhash's shingle features for ``text``."""
+    return _shingles(_feature_content(text))
+
+
+def _feature_content(text: str) -> str:
+    return "".join(FEATURE_RE.findall(text.lower()))
+
+
+def _shingles(content: str) -> Counter:
+    width = FEATURE_WIDTH
+    return Counter(
+        content[i : i + width] for i in range(max(len(content) - width + 1, 1))
+    )
+
+
+def _empty_rows() -> _Rows:
+    return (
+        np.zeros(0, dtype=np.int64),
+        np.zeros(0, dtype=np.uint64),
+        np.zeros(0, dtype=np.int64),
+    )
+
+
+class BatchSimhash:
+    """Computes SimHashes for batches of documents.
+
+    Feature hashes are memoized across batches, so shingles shared between
+    documents are hashed once per engine.
+    """
+
+    def __init__(self):
+        self.feature_hashes: Dict[str, int] = {}
+
+    def _hash_features(self, features: Iterable[str]) -> np.ndarray:
+        """Simhash's 64-bit md5 feature hash for each feature."""
+        known = self.feature_hashes
+        hashes = []
+        for feature in features:
+            value = known.get(feature)
+            if value is None:
+                digest = hashlib.md5(feature.encode("utf-8")).digest()
+                value = known[feature] = int.from_bytes(digest[-8:], "big")
+            hashes.append(value)
+        return np.asarray(hashes, dtype=np.uint64)
+
+    def compute(
+        self, texts: Sequence[Optional[str]], normalized: bool = False
+    ) -> List[Optional[int]]:
+        """Return the SimHash of each text (None for None or empty texts).
+
+        With ``normalized``, texts are taken to be lowercase runs of word
+        characters already (as produced by a tokenizer) and are used as
+        feature content without re-extraction.
+        """
+        results: List[Optional[int]] = [None] * len(texts)
+        for start in range(0, len(texts), BATCH_DOCS):
+            batch = texts[start : start + BATCH_DOCS]
+            for offset, value in self._compute_batch(batch, normalized).items():
+                results[start + offset] = value
+        return results
+
+    def _compute_batch(
+        self, texts: Sequence[Optional[str]], normalized: bool
+    ) -> Dict[int, int]:
+        if normalized:
+            contents = {i: text for i, text in enumerate(texts) if text}
+        else:
+            contents = {
+                i: _feature_content(text) for i, text in enumerate(texts) if text
+            }
+        if not contents:
+            return {}
+
+        long_docs = {i: c for i, c in contents.items() if len(c) >= FEATURE_WIDTH}
+        rows = self._features_by_array(long_docs)
+        if rows is None:
+            rows = self._features_by_counter(long_docs)
+        short_rows = self._features_by_counter(
+            {i: c for i, c in contents.items() if len(c) < FEATURE_WIDTH}
+        )
+        docs, hashes, weights = (
+            np.concatenate([a, b]) for a, b in zip(rows, short_rows)
+        )
+
+        size = len(texts)
+        totals = np.bincount(docs, weights=weights, minlength=size)
+
+        # Weighted per-bit sums: one (rows x 64) bit matrix product per
+        # document, as each document's rows are contiguous. Large documents
+        # are split into row blocks to bound memory.
+        sums = np.zeros((size, SIMHASH_BITS), dtype=np.int64)
+        bounds = (np.flatnonzero(np.diff(docs)) + 1).tolist()
+        for first, last in zip([0, *bounds], [*bounds, len(docs)]):
+            for start in range(first, last, _ROW_BLOCK):
+                end = min(start + _ROW_BLOCK, last)
+                # Big-endian bytes unpack to bits[:, 0] = most significant
+                # bit, matching Simhash
+                block_bits = np.unpackbits(
+                    hashes[start:end].astype(">u8").view(np.uint8)
+                ).reshape(-1, SIMHASH_BITS)
+                sums[docs[start]] += weights[start:end] @ block_bits
+
+        bits = sums * 2 > totals[:, None]
+        packed = np.packbits(bits, axis=1).view(">u8").ravel()
+        return {doc_index: int(packed[doc_index]) for doc_index in contents}
+
+    def _features_by_array(self, contents: Dict[int, str]) -> Optional[_Rows]:
+        """Vectorized (document, feature hash, count) rows.
+
+        Code points are renumbered densely so a shingle packs into a single
+        uint64 key; returns None if the batch has too many distinct
+        characters for that.
+        """
+        if not contents:
+            return _empty_rows()
+
+        codepoints = [
+            np.frombuffer(content.encode("utf-32-le"), dtype="<u4")
+            for content in contents.values()
+        ]
+        alphabet, dense = np.unique(np.concatenate(codepoints), return_inverse=True)
+        if len(alphabet) > 1 << _KEY_BITS:
+            return None
+        dense = dense.ravel().astype(np.uint64)
+
+        # Shingle keys per document, never spanning two documents
+        keys = []
+        owners = []
+        start = 0
+        for doc_index, points in zip(contents, codepoints):
+            ids = dense[start : start + len(points)]
+            start += len(points)
+            count = len(ids) - FEATURE_WIDTH + 1
+            key = np.zeros(count, dtype=np.uint64)
+            for offset in range(FEATURE_WIDTH):
+                key = (key << np.uint64(_KEY_BITS)) | ids[offset : offset + count]
+            keys.append(key)
+            owners.append(np.full(count, doc_index, dtype=np.int64))
+
+        # Distinct shingles, then (document, shingle) occurrence counts
+        distinct, inverse = np.unique(np.concatenate(keys), return_inverse=True)
+        pairs, counts = np.unique(
+            np.concatenate(owners) * len(distinct) + inverse.ravel(),
+            return_counts=True,
+        )
+
+        # Decode the distinct shingles back to text for hashing
+        columns = [
+            (distinct >> np.uint64(_KEY_BITS * (FEATURE_WIDTH - 1 - k)))
+            & np.uint64((1 << _KEY_BITS) - 1)
+            for k in range(FEATURE_WIDTH)
+        ]
+        chars = alphabet.astype("<u4")[np.stack(columns, axis=1).astype(np.intp)]
+        text = chars.tobytes().decode("utf-32-le")
+        features = (
+            text[i : i + FEATURE_WIDTH] for i in range(0, len(text), FEATURE_WIDTH)
+        )
+        distinct_hashes = self._hash_features(features)
+
+        docs = pairs // len(distinct)
+        hashes = distinct_hashes[pairs % len(distinct)]
+        return docs, hashes, counts.astype(np.int64)
+
+    def _features_by_counter(self, contents: Dict[int, str]) -> _Rows:
+        """Per-document feature rows, for short texts and odd batches."""
+        docs: List[int] = []
+        features: List[str] = []
+        weights: List[int] = []
+        for doc_index, content in contents.items():
+            for feature, count in _shingles(content).items():
+                docs.append(doc_index)
+                features.append(feature)
+                weights.append(count)
+        return (
+            np.asarray(docs, dtype=np.int64),
+            self._hash_features(features),
+            np.asarray(weights, dtype=np.int64),
+        )
+
+
+def batch_simhash(texts: Iterable[Optional[str]]) -> List[Optional[int]]:
+    """Compute SimHashes for ``texts`` with a fresh engine."""
+    return BatchSimhash().compute(list(texts))
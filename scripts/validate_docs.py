@@ -6,44 +6,105 @@ Validates all markdown files in docs/ for:
 - Required front-matter fields
 - Canonical uniqueness
 - Near-duplicate detection
+- Sections shared between documents
 - Status consistency
 
 Generates docs/index/registry.json for agent consumption.
 """
 
+import bisect
+import contextlib
+import functools
 import hashlib
+import importlib.util
+import itertools
 import json
+import os
 import pathlib
+import queue
 import re
+import subprocess
 import sys
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
-
-try:
-    import yaml
-except ImportError:
-    print("ERROR: PyYAML not installed. Run: pip install pyyaml")
-    sys.exit(1)
-
-try:
-    from simhash import Simhash
-except ImportError:
-    print("WARNING: simhash not installed. Duplicate detection disabled.")
-    print("To enable: pip install simhash")
-    Simhash = None
-
-try:
-    from rapidfuzz import fuzz
-except ImportError:
-    print("WARNING: rapidfuzz not installed. Fuzzy matching disabled.")
-    print("To enable: pip install rapidfuzz")
-    fuzz = None
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import docs_chunks
+import docs_frontmatter
+from docs_chunks import ChunkIndex, chunk_fingerprints
+from docs_frontmatter import MarkdownDocument
+from docs_parse_cache import ParseCache
+
+# Optional dependencies are imported on first use, so runs that don't hash
+# or compare anything (e.g. nothing changed since the cached run) don't pay
+# for loading them
+
+
+@functools.lru_cache(maxsize=None)
+def load_simhash() -> Any:
+    """The ``Simhash`` class, or None (with a warning) if not installed."""
+    try:
+        from simhash import Simhash
+    except ImportError:
+        print("WARNING: simhash not installed. Duplicate detection disabled.")
+        print("To enable: pip install simhash")
+        return None
+    return Simhash
+
+
+@functools.lru_cache(maxsize=None)
+def load_batch_simhash() -> Any:
+    """The ``BatchSimhash`` engine, or None if NumPy is not installed."""
+    if load_simhash() is None:
+        return None
+    try:
+        from docs_simhash import BatchSimhash
+    except ImportError:
+        # NumPy comes with simhash; without it SimHashes are computed per file
+        return None
+    return BatchSimhash
+
+
+@functools.lru_cache(maxsize=None)
+def load_rapidfuzz() -> Any:
+    """The ``rapidfuzz`` package, or None (with a warning) if not installed."""
+    try:
+        import rapidfuzz.fuzz
+        import rapidfuzz.process
+    except ImportError:
+        print("WARNING: rapidfuzz not installed. Fuzzy matching disabled.")
+        print("To enable: pip install rapidfuzz")
+        return None
+    return rapidfuzz
+
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 DOCS = ROOT / "docs"
 INBOX = DOCS / "_inbox"
 ARCHIVE = DOCS / "archive"
 REGISTRY = DOCS / "index" / "registry.json"
+REGISTRY_DB = DOCS / "index" / "registry.sqlite"
+REGISTRY_INDEX = DOCS / "index" / "registry-index.json"
+
+# registry.json and registry-index.json start with their generation timestamp
+GENERATED_AT_RE = re.compile(r'\{\s*"generated_at":\s*"([^"]*)"')
+CACHE = DOCS / "index" / ".registry-cache.json"
+# Parsed headers, shared with organize_docs.py (see docs_parse_cache.py)
+PARSE_CACHE = DOCS / "index" / ".parse-cache.json"
+
+# Bump when the shape of cached entries or errors changes
+CACHE_VERSION = 2
 
 # Paths to exclude from validation
 EXCLUDE_PATTERNS = [
@@ -79,6 +140,12 @@ VALID_DOC_TYPES = [
 ]
 VALID_STATUSES = ["draft", "active", "superseded", "rejected", "archived"]
 
+# Near-duplicate thresholds
+SIMHASH_BITS = 64
+SIMHASH_MAX_DISTANCE = 8  # Hamming distance between 64-bit SimHashes
+TITLE_MIN_SCORE = 80  # rapidfuzz token_set_ratio
+SHARED_MIN_CHUNKS = 2  # Sampled chunk fingerprints (see docs_chunks.py)
+
 
 class ValidationError:
     def __init__(self, path: pathlib.Path, message: str, severity: str = "error"):
@@ -91,41 +158,66 @@ class ValidationError:
         return f"[{self.severity.upper()}] {rel_path}: {self.message}"
 
 
-def extract_frontmatter(text: str) -> Tuple[Optional[Dict], str]:
-    """Extract YAML front-matter and body from markdown."""
-    match = re.match(r"^---\r?\n(.*?)\r?\n---\r?\n", text, re.S)
-    if not match:
-        return None, text
+# Tokenizer: fenced code, inline code and URLs are matched and skipped,
+# word runs are captured
+TOKEN_RE = re.compile(r"`(?:``.*?```|[^`]+`)|https?://\S+|(\w+)", re.S)
+WORD_RE = re.compile(r"\w+")
 
-    try:
-        meta = yaml.safe_load(match.group(1))
-        body = text[match.end() :]
-        return meta or {}, body
-    except yaml.YAMLError as e:
-        return {"_parse_error": str(e)}, text
+
+def iter_tokens(text: str) -> Iterator[str]:
+    """Yield the lowercase word tokens of ``text``.
+
+    Code and URLs are dropped in the same left-to-right pass that finds the
+    words, so no stripped copies of the text are built.
+    """
+    for word in TOKEN_RE.findall(text):
+        if word:
+            lowered = word.lower()
+            if len(lowered) != len(word):
+                # Some capitals lowercase to a letter plus a combining mark,
+                # which is not a word character
+                yield from WORD_RE.findall(lowered)
+            else:
+                yield lowered
 
 
 def normalize_text(text: str) -> str:
     """Normalize text for similarity comparison."""
-    # Remove code blocks
-    text = re.sub(r"```.*?```", "", text, flags=re.S)
-    # Remove inline code
-    text = re.sub(r"`[^`]+`", "", text)
-    # Remove URLs
-    text = re.sub(r"https?://\S+", "", text)
-    # Lowercase and remove non-word chars
-    text = re.sub(r"\W+", " ", text.lower())
-    return text.strip()
+    return " ".join(iter_tokens(text))
+
+
+def simhash_content(text: str) -> str:
+    """The feature string SimHash derives from ``normalize_text(text)``.
+
+    Simhash keeps only word characters of the lowercased text, so the
+    concatenated tokens are its input as-is.
+    """
+    return "".join(iter_tokens(text))
+
+
+def compute_simhashes(texts: List[str]) -> List[Optional[str]]:
+    """Compute SimHashes for many ``simhash_content`` strings in one batch."""
+    if not texts or load_simhash() is None:
+        return [None] * len(texts)
+    engine = load_batch_simhash()
+    if engine is None:
+        return [_simhash_value(text) for text in texts]
+    return [
+        None if value is None else str(value)
+        for value in engine().compute(texts, normalized=True)
+    ]
 
 
 def compute_simhash(text: str) -> Optional[str]:
     """Compute SimHash for duplicate detection."""
-    if Simhash is None:
-        return None
-    normalized = normalize_text(text)
-    if not normalized:
+    return _simhash_value(simhash_content(text))
+
+
+def _simhash_value(content: str) -> Optional[str]:
+    if not content:
         return None
-    return str(Simhash(normalized).value)
+    simhash = load_simhash()
+    return None if simhash is None else str(simhash(content).value)
 
 
 def compute_sha256(text: str) -> str:
@@ -219,17 +311,25 @@ def validate_frontmatter(path: pathlib.Path, meta: Dict) -> List[ValidationError
     return errors
 
 
+def concept_key(title: Any) -> str:
+    """Normalize a title to the concept key canonical docs are unique by."""
+    return re.sub(r"\W+", " ", str(title).lower()).strip()
+
+
 def validate_canonical_uniqueness(
     entries: List[Dict[str, Any]],
+    changed: Optional[Set[str]] = None,
 ) -> List[ValidationError]:
-    """Ensure only one canonical doc per concept (normalized title)."""
+    """Ensure only one canonical doc per concept (normalized title).
+
+    If ``changed`` is given, only conflicts involving one of those paths
+    are reported.
+    """
     errors: List[ValidationError] = []
     by_concept: Dict[str, List[Dict[str, Any]]] = {}
 
     for entry in entries:
-        # Normalize title to concept key
-        title = entry.get("title", "")
-        concept = re.sub(r"\W+", " ", title.lower()).strip()
+        concept = concept_key(entry.get("title", ""))
 
         if not concept:
             continue
@@ -241,6 +341,8 @@ def validate_canonical_uniqueness(
 
         if len(canonical) > 1:
             paths = [e["path"] for e in canonical]
+            if changed is not None and changed.isdisjoint(paths):
+                continue
             errors.append(
                 ValidationError(
                     ROOT,
@@ -252,70 +354,752 @@ def validate_canonical_uniqueness(
     return errors
 
 
+class ConceptIndex:
+    """Canonical corpus docs by concept key, maintained incrementally.
+
+    Only the titles of updated entries are normalized, so checking a few
+    changed documents for canonical conflicts does not touch the rest of
+    the corpus. Inbox drafts are not indexed.
+    """
+
+    def __init__(self, by_path: Optional[Dict[str, str]] = None):
+        self.by_path: Dict[str, str] = {}  # Path -> concept
+        self.concepts: Dict[str, List[str]] = {}  # Concept -> sorted paths
+        for path, concept in (by_path or {}).items():
+            self._add(path, concept)
+
+    def _add(self, path: str, concept: str) -> None:
+        self.by_path[path] = concept
+        bisect.insort(self.concepts.setdefault(concept, []), path)
+
+    def update(self, path: str, entry: Optional[Dict[str, Any]]) -> None:
+        """Re-index ``path`` from its current registry entry (None if gone)."""
+        self.discard(path)
+        if entry is None or not entry.get("canonical") or "/_inbox/" in path:
+            return
+        concept = concept_key(entry.get("title", ""))
+        if concept:
+            self._add(path, concept)
+
+    def discard(self, path: str) -> None:
+        concept = self.by_path.pop(path, None)
+        if concept is None:
+            return
+        paths = self.concepts[concept]
+        paths.remove(path)
+        if not paths:
+            del self.concepts[concept]
+
+    def related(self, changed: Set[str]) -> Set[str]:
+        """Other paths sharing a concept with any of the ``changed`` paths."""
+        related: Set[str] = set()
+        for path in changed:
+            if path in self.by_path:
+                related.update(self.concepts[self.by_path[path]])
+        return related - changed
+
+    def conflicts(self, changed: Set[str]) -> List[ValidationError]:
+        """Canonical conflicts involving any of the ``changed`` paths."""
+        concepts = sorted({self.by_path[p] for p in changed if p in self.by_path})
+        return [
+            ValidationError(
+                ROOT,
+                f"Multiple canonical docs for concept '{concept}':\n  "
+                + "\n  ".join(self.concepts[concept]),
+            )
+            for concept in concepts
+            if len(self.concepts[concept]) > 1
+        ]
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return bin(a ^ b).count("1")
+
+
+class SimhashIndex:
+    """Permuted-table index for Hamming-distance lookups on SimHashes.
+
+    The fingerprint is split into ``blocks`` bit ranges. Two fingerprints
+    within ``max_distance`` bits differ in at most ``max_distance`` blocks,
+    so they agree exactly on at least ``blocks - max_distance`` of them
+    (pigeonhole). One table is kept per combination of that many blocks,
+    keyed by the masked fingerprint, and a query only verifies items that
+    share a key with it in some table.
+    """
+
+    def __init__(
+        self,
+        max_distance: int = SIMHASH_MAX_DISTANCE,
+        blocks: int = 10,
+        bits: int = SIMHASH_BITS,
+    ):
+        if not max_distance < blocks <= bits:
+            raise ValueError("blocks must be in (max_distance, bits]")
+
+        self.max_distance = max_distance
+
+        # Split the fingerprint into blocks of (nearly) equal width
+        block_masks = []
+        start = 0
+        for i in range(blocks):
+            width = bits // blocks + (1 if i < bits % blocks else 0)
+            block_masks.append(((1 << width) - 1) << start)
+            start += width
+
+        self.masks = [
+            sum(combo)
+            for combo in itertools.combinations(block_masks, blocks - max_distance)
+        ]
+        self.tables: List[Dict[int, List[int]]] = [{} for _ in self.masks]
+        self.values: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add(self, key: int, value: int) -> None:
+        """Index ``value`` under the integer ``key``, replacing any previous one."""
+        if key in self.values:
+            self.remove(key)
+        self.values[key] = value
+        for mask, table in zip(self.masks, self.tables):
+            table.setdefault(value & mask, []).append(key)
+
+    def remove(self, key: int) -> None:
+        """Drop ``key`` from the index, if present."""
+        value = self.values.pop(key, None)
+        if value is None:
+            return
+        for mask, table in zip(self.masks, self.tables):
+            bucket = table[value & mask]
+            bucket.remove(key)
+            if not bucket:
+                del table[value & mask]
+
+    def query(self, value: int) -> List[Tuple[int, int]]:
+        """Return ``(key, distance)`` for indexed values within range, by key."""
+        candidates: Set[int] = set()
+        for mask, table in zip(self.masks, self.tables):
+            candidates.update(table.get(value & mask, ()))
+
+        matches = []
+        for key in sorted(candidates):
+            distance = hamming_distance(value, self.values[key])
+            if distance <= self.max_distance:
+                matches.append((key, distance))
+        return matches
+
+
 def detect_near_duplicates(entries: List[Dict[str, Any]]) -> List[ValidationError]:
     """Detect near-duplicate documents between inbox and corpus."""
-    if Simhash is None or fuzz is None:
+    inbox_entries = [e for e in entries if "/_inbox/" in e["path"]]
+    if not inbox_entries:
         return []
 
+    corpus_entries = [e for e in entries if "/_inbox/" not in e["path"]]
+
+    index = SimhashIndex()
+    for position, corpus_entry in enumerate(corpus_entries):
+        corpus_hash = corpus_entry.get("simhash")
+        if corpus_hash:
+            index.add(position, int(corpus_hash))
+
+    return find_near_duplicates(inbox_entries, index, corpus_entries)
+
+
+def score_titles(pairs: List[Tuple[Any, Any]]) -> List[float]:
+    """token_set_ratio of many title pairs, scored in one multi-threaded call.
+
+    Scores below TITLE_MIN_SCORE come back as 0, as do all scores without
+    rapidfuzz. rapidfuzz is only imported once there are pairs to score.
+    Its batch functions need NumPy, which rapidfuzz itself doesn't depend
+    on; without it, pairs are scored one at a time.
+    """
+    if not pairs:
+        return []
+    rapidfuzz = load_rapidfuzz()
+    if rapidfuzz is None:
+        return [0.0] * len(pairs)
+    try:
+        import numpy as np
+    except ImportError:
+        return [
+            rapidfuzz.fuzz.token_set_ratio(query, choice, score_cutoff=TITLE_MIN_SCORE)
+            for query, choice in pairs
+        ]
+
+    process = rapidfuzz.process
+    queries = [query for query, _ in pairs]
+    choices = [choice for _, choice in pairs]
+    options = {
+        "scorer": rapidfuzz.fuzz.token_set_ratio,
+        "score_cutoff": TITLE_MIN_SCORE,
+        "workers": -1,
+        "dtype": np.float64,
+    }
+    if hasattr(process, "cpdist"):
+        # rapidfuzz >= 3.6 scores just the given pairs
+        return process.cpdist(queries, choices, **options).tolist()
+
+    # Otherwise score distinct queries against distinct choices
+    query_rows = {title: row for row, title in enumerate(dict.fromkeys(queries))}
+    choice_columns = {
+        title: column for column, title in enumerate(dict.fromkeys(choices))
+    }
+    matrix = process.cdist(list(query_rows), list(choice_columns), **options)
+    return [
+        float(matrix[query_rows[query], choice_columns[choice]])
+        for query, choice in pairs
+    ]
+
+
+def find_near_duplicates(
+    inbox_entries: List[Dict[str, Any]],
+    index: SimhashIndex,
+    corpus: Mapping[int, Dict[str, Any]],
+) -> List[ValidationError]:
+    """Report the first corpus entry (by index key) each inbox entry duplicates.
+
+    ``corpus`` maps the keys used in ``index`` to corpus entries. Titles of
+    all SimHash candidates are scored in one batch.
+    """
+    # Candidates come back in key order, already within SimHash range
+    candidates = [
+        (inbox_entry, key, hamming)
+        for inbox_entry in inbox_entries
+        if inbox_entry.get("simhash")
+        for key, hamming in index.query(int(inbox_entry["simhash"]))
+    ]
+
+    # Double-check with title similarity
+    scores = score_titles(
+        [
+            (inbox_entry.get("title", ""), corpus[key].get("title", ""))
+            for inbox_entry, key, _ in candidates
+        ]
+    )
+
     errors: List[ValidationError] = []
+    reported: Set[str] = set()
+    for (inbox_entry, key, hamming), title_score in zip(candidates, scores):
+        # Only report first match per inbox doc
+        if title_score < TITLE_MIN_SCORE or inbox_entry["path"] in reported:
+            continue
+        reported.add(inbox_entry["path"])
+        errors.append(
+            ValidationError(
+                ROOT,
+                f"Near-duplicate detected:\n"
+                f"  Inbox:  {inbox_entry['path']}\n"
+                f"  Corpus: {corpus[key]['path']}\n"
+                f"  Title similarity: {title_score}%, Content similarity: {100 - hamming * 2}%",
+                severity="warning",
+            )
+        )
+
+    return errors
+
+
+class DisjointSet:
+    """Union-find over integer keys, with path halving and union by size."""
+
+    def __init__(self):
+        self.parent: Dict[int, int] = {}
+        self.size: Dict[int, int] = {}
+
+    def find(self, key: int) -> int:
+        parent = self.parent
+        parent.setdefault(key, key)
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if self.size.get(root_a, 1) < self.size.get(root_b, 1):
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] = self.size.get(root_a, 1) + self.size.pop(root_b, 1)
+
+    def groups(self) -> List[List[int]]:
+        """Sets with more than one member, each sorted, ordered by first key."""
+        members: Dict[int, List[int]] = {}
+        for key in sorted(self.parent):
+            members.setdefault(self.find(key), []).append(key)
+        return [group for group in members.values() if len(group) > 1]
+
+
+def find_duplicate_clusters(entries: List[Dict[str, Any]]) -> List[ValidationError]:
+    """Group every set of near-duplicate documents in ``entries``.
+
+    Pairs are near-duplicates by the same test as detect_near_duplicates()
+    (SimHash distance, then title similarity), but across all entries
+    rather than inbox against corpus. Candidate pairs come from the
+    SimhashIndex, are title-scored in one batch and merged with
+    union-find, so the work grows with the number of documents and
+    candidates, not with all pairs. Each cluster is reported once.
+    """
+    index = SimhashIndex()
+    for position, entry in enumerate(entries):
+        if entry.get("simhash"):
+            index.add(position, int(entry["simhash"]))
+
+    pairs = [
+        (position, other)
+        for position, value in index.values.items()
+        for other, _ in index.query(value)
+        if other > position
+    ]
+    scores = score_titles(
+        [(entries[a].get("title", ""), entries[b].get("title", "")) for a, b in pairs]
+    )
+
+    clusters = DisjointSet()
+    for (a, b), score in zip(pairs, scores):
+        if score >= TITLE_MIN_SCORE:
+            clusters.union(a, b)
+
+    return [
+        ValidationError(
+            ROOT,
+            f"Near-duplicate cluster ({len(group)} docs):\n  "
+            + "\n  ".join(entries[position]["path"] for position in group),
+            severity="warning",
+        )
+        for group in clusters.groups()
+    ]
+
+
+def detect_shared_sections(entries: List[Dict[str, Any]]) -> List[ValidationError]:
+    """Detect inbox documents that share sections with corpus documents."""
     inbox_entries = [e for e in entries if "/_inbox/" in e["path"]]
+    if not inbox_entries:
+        return []
+
     corpus_entries = [e for e in entries if "/_inbox/" not in e["path"]]
+    index = ChunkIndex()
+    for position, corpus_entry in enumerate(corpus_entries):
+        index.add(position, corpus_entry.get("chunks") or [])
 
-    for inbox_entry in inbox_entries:
-        inbox_hash = inbox_entry.get("simhash")
-        if not inbox_hash:
-            continue
+    return find_shared_sections(inbox_entries, index, corpus_entries)
 
-        for corpus_entry in corpus_entries:
-            corpus_hash = corpus_entry.get("simhash")
-            if not corpus_hash:
-                continue
 
-            # Fast SimHash comparison (Hamming distance)
-            hamming = bin(int(inbox_hash) ^ int(corpus_hash)).count("1")
-
-            if hamming <= 8:  # Threshold for similarity
-                # Double-check with title similarity
-                inbox_title = inbox_entry.get("title", "")
-                corpus_title = corpus_entry.get("title", "")
-                title_score = fuzz.token_set_ratio(inbox_title, corpus_title)
-
-                if title_score >= 80:
-                    errors.append(
-                        ValidationError(
-                            ROOT,
-                            f"Near-duplicate detected:\n"
-                            f"  Inbox:  {inbox_entry['path']}\n"
-                            f"  Corpus: {corpus_entry['path']}\n"
-                            f"  Title similarity: {title_score}%, Content similarity: {100 - hamming * 2}%",
-                            severity="warning",
-                        )
-                    )
-                    break  # Only report first match per inbox doc
+def simhash_close(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    """Whether two entries' whole-document SimHashes are within range."""
+    if not a.get("simhash") or not b.get("simhash"):
+        return False
+    distance = hamming_distance(int(a["simhash"]), int(b["simhash"]))
+    return distance <= SIMHASH_MAX_DISTANCE
+
+
+def shares_sections(count: int, chunks: List[str], other: List[str]) -> bool:
+    """Whether ``count`` common fingerprints are enough to report a pair.
+
+    SHARED_MIN_CHUNKS are needed, or the smaller document's whole sample
+    when it holds fewer: a short document pasted into a long one may
+    only have one sampled chunk.
+    """
+    return count >= min(SHARED_MIN_CHUNKS, len(chunks), len(other))
 
+
+def find_shared_sections(
+    inbox_entries: List[Dict[str, Any]],
+    index: ChunkIndex,
+    corpus: Mapping[int, Dict[str, Any]],
+) -> List[ValidationError]:
+    """Report corpus entries (by index key) sharing sections with inbox entries.
+
+    Pairs that are similar as a whole are left to the near-duplicate check.
+    """
+    errors: List[ValidationError] = []
+    for inbox_entry in inbox_entries:
+        chunks = inbox_entry.get("chunks") or []
+        for key, count in sorted(index.shared(chunks).items()):
+            enough = shares_sections(count, chunks, corpus[key].get("chunks") or [])
+            if not enough or simhash_close(inbox_entry, corpus[key]):
+                continue
+            errors.append(
+                ValidationError(
+                    ROOT,
+                    f"Shared sections detected:\n"
+                    f"  Inbox:  {inbox_entry['path']}\n"
+                    f"  Corpus: {corpus[key]['path']}\n"
+                    f"  Shared chunks: {count} of {len(chunks)}",
+                    severity="warning",
+                )
+            )
     return errors
 
 
-def process_documents() -> Tuple[List[Dict[str, Any]], List[ValidationError]]:
-    """Process all markdown documents and collect errors."""
-    entries: List[Dict[str, Any]] = []
+def find_shared_section_pairs(entries: List[Dict[str, Any]]) -> List[ValidationError]:
+    """Report every pair of ``entries`` sharing sections, once per pair.
+
+    The corpus-wide counterpart of detect_shared_sections(), for
+    --dedupe-corpus; each entry is looked up in a ChunkIndex of all of them.
+    """
+    index = ChunkIndex()
+    for position, entry in enumerate(entries):
+        index.add(position, entry.get("chunks") or [])
+
     errors: List[ValidationError] = []
+    for position, chunks in sorted(index.fingerprints.items()):
+        for other, count in sorted(index.shared(chunks).items()):
+            if (
+                other <= position
+                or not shares_sections(count, chunks, index.fingerprints[other])
+                or simhash_close(entries[position], entries[other])
+            ):
+                continue
+            errors.append(
+                ValidationError(
+                    ROOT,
+                    f"Shared sections ({count} chunks):\n"
+                    f"  {entries[position]['path']}\n"
+                    f"  {entries[other]['path']}",
+                    severity="warning",
+                )
+            )
+    return errors
 
-    # Find all markdown files in docs/
-    for md_path in DOCS.rglob("*.md"):
-        if should_exclude(md_path):
-            continue
 
+class RegistryCache:
+    """Persistent per-file cache of registry entries and validation errors.
+
+    Records are keyed by repo-relative path and validated against the file's
+    mtime and size; when those changed but the content hash did not, the
+    previous record is still reused without re-parsing.
+
+    The cache also keeps the ConceptIndex of its entries. Once a full run
+    has refreshed every record (``complete``), partial runs can check
+    canonical conflicts against it instead of the whole corpus. Documents
+    can change without a run seeing them (a pull, a checkout), so partial
+    runs rebuild it from registry.json whenever that was regenerated since
+    (``registry_generated_at``).
+    """
+
+    def __init__(self, path: Optional[pathlib.Path] = None):
+        self.path = path or CACHE
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.concepts = ConceptIndex()
+        self.complete = False
+        # generated_at of the registry.json the concepts were synced with
+        self.registry_generated_at: Optional[str] = None
+        self.dirty = False
+
+    @staticmethod
+    def fingerprint() -> str:
+        """Identify the validator build that produced the cached records."""
+        digest = hashlib.sha256()
+        # docs_simhash.py is read, not imported, as it loads NumPy
+        scripts = pathlib.Path(__file__).parent
+        for module in (
+            __file__,
+            docs_chunks.__file__,
+            docs_frontmatter.__file__,
+            scripts / "docs_parse_cache.py",
+            scripts / "docs_simhash.py",
+        ):
+            digest.update(pathlib.Path(module).read_bytes())
+        # Whether SimHashes were computed, without importing simhash
+        has_simhash = importlib.util.find_spec("simhash") is not None
+        digest.update(f"simhash={has_simhash}".encode())
+        return digest.hexdigest()
+
+    def load(self) -> None:
+        """Load cached records, discarding them if stale or unreadable."""
         try:
-            content = md_path.read_text(encoding="utf-8")
-        except Exception as e:
-            errors.append(ValidationError(md_path, f"Failed to read file: {e}"))
-            continue
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if (
+            data.get("version") == CACHE_VERSION
+            and data.get("fingerprint") == self.fingerprint()
+        ):
+            self.files = data.get("files", {})
+            self.concepts = ConceptIndex(data.get("concepts", {}))
+            self.complete = data.get("complete", False)
+            self.registry_generated_at = data.get("registry_generated_at")
+
+    def save(self) -> None:
+        """Write the cache atomically if anything changed."""
+        if not self.dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": CACHE_VERSION,
+            "fingerprint": self.fingerprint(),
+            "complete": self.complete,
+            "registry_generated_at": self.registry_generated_at,
+            "concepts": self.concepts.by_path,
+            "files": self.files,
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"), default=str)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def sync_concepts(
+        self, entries: List[Dict[str, Any]], generated_at: Optional[str]
+    ) -> None:
+        """Rebuild the ConceptIndex from ``entries`` if the registry changed.
+
+        ``entries`` are the registry's (with staged documents swapped in)
+        and ``generated_at`` its timestamp; nothing is done if the index
+        was last synced with the same registry.
+        """
+        if generated_at is None or generated_at == self.registry_generated_at:
+            return
+        self.concepts = ConceptIndex()
+        for entry in entries:
+            self.concepts.update(entry["path"], entry)
+        self.registry_generated_at = generated_at
+        self.dirty = True
+
+    def lookup(self, rel_path: str, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Return the cached record if the file's mtime and size are unchanged."""
+        record = self.files.get(rel_path)
+        if (
+            record
+            and record["mtime_ns"] == st.st_mtime_ns
+            and record["size"] == st.st_size
+        ):
+            return record
+        return None
 
-        meta, body = extract_frontmatter(content)
+    def store(
+        self,
+        rel_path: str,
+        st: os.stat_result,
+        sha256: Optional[str],
+        entry: Optional[Dict[str, Any]],
+        errors: List[ValidationError],
+    ) -> None:
+        self.files[rel_path] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "sha256": sha256,
+            "entry": entry,
+            "errors": [[e.severity, e.message] for e in errors],
+        }
+        self.concepts.update(rel_path, entry)
+        self.dirty = True
+
+    def forget(self, rel_path: str) -> None:
+        """Drop the record of a deleted file."""
+        if self.files.pop(rel_path, None) is not None:
+            self.concepts.discard(rel_path)
+            self.dirty = True
+
+    def prune(self, seen: Set[str]) -> None:
+        """Drop records for files that no longer exist.
+
+        Called after a full run, which leaves every record current.
+        """
+        stale = [rel_path for rel_path in self.files if rel_path not in seen]
+        for rel_path in stale:
+            self.forget(rel_path)
+        if not self.complete:
+            self.complete = True
+            self.dirty = True
+
+    @staticmethod
+    def restore_errors(
+        path: pathlib.Path, record: Dict[str, Any]
+    ) -> List[ValidationError]:
+        return [
+            ValidationError(path, message, severity)
+            for severity, message in record["errors"]
+        ]
+
+
+class FileResult(NamedTuple):
+    """Outcome of processing one document."""
+
+    entry: Optional[Dict[str, Any]]
+    errors: List[ValidationError]
+    sha256: Optional[str]  # Only computed for documents with front-matter
+    cacheable: bool  # False if the file could not be read
+    # simhash_content of the body, still to be hashed (deferred mode)
+    simhash_text: Optional[str] = None
+    # FileTimer.record(), when timed
+    timings: Optional[Dict[str, Any]] = None
+
+
+# Per-file phases reported by --timings / --profile
+FILE_PHASES = ("read", "parse", "hash", "validate")
+
+
+class FileTimer:
+    """Accumulates the time spent in each phase of processing one file."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases = dict.fromkeys(FILE_PHASES, 0.0)
+
+    def lap(self, phase: str) -> None:
+        """Charge the time since the previous lap to ``phase``."""
+        now = time.perf_counter()
+        self.phases[phase] += now - self.last
+        self.last = now
+
+    def record(self) -> Dict[str, Any]:
+        return {"start": self.start, "pid": os.getpid(), **self.phases}
+
+
+class _NullTimer:
+    def lap(self, phase: str) -> None:
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+class Timings:
+    """Stage and per-file durations collected for --timings / --profile."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.stages: List[Dict[str, Any]] = []
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.depth = 0
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a (possibly nested) stage."""
+        record = {"name": name, "start": time.perf_counter(), "depth": self.depth}
+        self.stages.append(record)
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            record["seconds"] = time.perf_counter() - record["start"]
+
+    def add_file(self, rel_path: str, record: Dict[str, Any]) -> None:
+        self.files[rel_path] = record
+
+    @staticmethod
+    def file_seconds(record: Dict[str, Any]) -> float:
+        return sum(record[phase] for phase in FILE_PHASES)
+
+    def print_report(self, count: int) -> None:
+        """Print the stage table and the ``count`` slowest files."""
+        print("Timings:")
+        print(f"  {'Stage':<36} {'Seconds':>9}")
+        for record in self.stages:
+            name = "  " * record["depth"] + record["name"]
+            print(f"  {name:<36} {record['seconds']:>9.3f}")
+        print()
+
+        if not self.files:
+            return
+        slowest = sorted(
+            self.files.items(),
+            key=lambda item: self.file_seconds(item[1]),
+            reverse=True,
+        )[:count]
+        print(f"Slowest files ({len(slowest)} of {len(self.files)} processed, ms):")
+        header = "".join(f"{phase:>9}" for phase in FILE_PHASES)
+        print(f"  {'total':>9}{header}  path")
+        for rel_path, record in slowest:
+            phases = "".join(f"{record[phase] * 1000:>9.2f}" for phase in FILE_PHASES)
+            print(f"  {self.file_seconds(record) * 1000:>9.2f}{phases}  {rel_path}")
+        print()
+
+    def write_trace(self, path: pathlib.Path) -> None:
+        """Write stages and files in Chrome trace event format.
+
+        The file loads in chrome://tracing or Perfetto; files processed in
+        worker processes appear on one track per worker.
+        """
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {
+                "name": record["name"],
+                "cat": "stage",
+                "ph": "X",
+                "ts": (record["start"] - self.origin) * 1e6,
+                "dur": record["seconds"] * 1e6,
+                "pid": pid,
+                "tid": 0,
+            }
+            for record in self.stages
+        ]
+        for rel_path, record in self.files.items():
+            events.append(
+                {
+                    "name": rel_path,
+                    "cat": "file",
+                    "ph": "X",
+                    "ts": (record["start"] - self.origin) * 1e6,
+                    "dur": self.file_seconds(record) * 1e6,
+                    "pid": pid,
+                    "tid": record["pid"],
+                    "args": {phase: record[phase] for phase in FILE_PHASES},
+                }
+            )
+
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+            f.write("\n")
+
+
+def timed_stage(timings: Optional[Timings], name: str) -> ContextManager[Any]:
+    """``timings.stage(name)``, or a no-op context when not timing."""
+    return timings.stage(name) if timings else contextlib.nullcontext()
+
+
+def process_file(
+    md_path: pathlib.Path,
+    previous: Optional[Dict[str, Any]] = None,
+    defer_simhash: bool = False,
+    timed: bool = False,
+    parse_cache: Optional[ParseCache] = None,
+) -> FileResult:
+    """Read, parse and validate a single markdown document.
+
+    The front-matter is read first. The sha256 is computed from the raw
+    file bytes, and the body is only decoded when the file has
+    front-matter and its SimHash is needed. If ``previous`` is a cache
+    record with the same content hash, its results are reused instead of
+    re-parsing. With ``defer_simhash`` the entry's SimHash is left unset
+    and the normalized body is returned for batch hashing instead. With
+    ``timed`` the time spent per phase is returned in the result. The
+    document is opened through ``parse_cache`` if given.
+    """
+    if not timed:
+        return _process_file(md_path, previous, defer_simhash, NULL_TIMER, parse_cache)
+    timer = FileTimer()
+    result = _process_file(md_path, previous, defer_simhash, timer, parse_cache)
+    return result._replace(timings=timer.record())
+
+
+def _process_file(
+    md_path: pathlib.Path,
+    previous: Optional[Dict[str, Any]],
+    defer_simhash: bool,
+    timer: Any,
+    parse_cache: Optional[ParseCache],
+) -> FileResult:
+    errors: List[ValidationError] = []
+
+    try:
+        if parse_cache is not None:
+            document = parse_cache.open(md_path)
+        else:
+            document = MarkdownDocument(md_path)
+        timer.lap("read")
 
         # Files without front-matter
-        if meta is None:
+        if not document.has_frontmatter:
             # Only warn for non-inbox files
             if "/_inbox/" not in str(md_path):
                 errors.append(
@@ -325,41 +1109,276 @@ def process_documents() -> Tuple[List[Dict[str, Any]], List[ValidationError]]:
                         severity="warning",
                     )
                 )
+            return FileResult(None, errors, None, True)
+
+        sha256 = document.sha256()
+        timer.lap("hash")
+        if previous and previous["sha256"] == sha256:
+            return FileResult(
+                previous["entry"],
+                RegistryCache.restore_errors(md_path, previous),
+                sha256,
+                True,
+            )
+
+        meta = document.frontmatter
+        timer.lap("parse")
+        # Unparseable front-matter is hashed along with the body
+        body = document.text if "_parse_error" in meta else document.body
+        timer.lap("read")
+    except Exception as e:
+        errors.append(ValidationError(md_path, f"Failed to read file: {e}"))
+        return FileResult(None, errors, None, False)
+
+    # Validate front-matter
+    errors.extend(validate_frontmatter(md_path, meta))
+    timer.lap("validate")
+
+    # Build registry entry
+    entry: Dict[str, Any] = {
+        "path": str(md_path.relative_to(ROOT)).replace("\\", "/"),
+        "doc_id": meta.get("doc_id", ""),
+        "title": meta.get("title", ""),
+        "doc_type": meta.get("doc_type", ""),
+        "status": meta.get("status", ""),
+        "canonical": bool(meta.get("canonical", False)),
+        "tags": meta.get("tags", []),
+        "created": str(meta.get("created", "")),
+        "summary": meta.get("summary", ""),
+        "supersedes": meta.get("supersedes", []),
+        "related": meta.get("related", []),
+        "sha256": sha256,
+    }
+    # One tokenization feeds both the SimHash and the section chunks
+    tokens = list(iter_tokens(body))
+    content = "".join(tokens)
+    entry["simhash"] = None if defer_simhash else _simhash_value(content)
+    entry["chunks"] = chunk_fingerprints(tokens)
+    simhash_text = content if defer_simhash else None
+    timer.lap("hash")
+    return FileResult(entry, errors, sha256, True, simhash_text)
+
+
+def process_documents(
+    use_cache: bool = True,
+    jobs: int = 1,
+    paths: Optional[List[pathlib.Path]] = None,
+    timings: Optional[Timings] = None,
+    cache: Optional[RegistryCache] = None,
+) -> Tuple[List[Dict[str, Any]], List[ValidationError]]:
+    """Process all markdown documents and collect errors.
+
+    Unchanged files are served from the registry cache when ``use_cache``
+    is set, so only new or modified documents are read and parsed. With
+    ``jobs`` > 1 the remaining files are parsed in a process pool; results
+    are merged in path order, so output does not depend on scheduling.
+    Otherwise the SimHashes of all parsed files are computed in one batch
+    (see docs_simhash.py), hashing shingles shared between documents once,
+    and with ``use_cache`` headers come from the parse cache shared with
+    organize_docs.py.
+    If ``paths`` is given, only those documents are processed instead of
+    scanning the whole docs/ tree. Per-file phase durations are recorded
+    in ``timings`` if given. A loaded ``cache`` may be passed in to use it
+    afterwards; it is updated and saved either way.
+    """
+    entries: List[Dict[str, Any]] = []
+    errors: List[ValidationError] = []
+
+    if cache is None and use_cache:
+        cache = RegistryCache()
+        cache.load()
+    seen: Set[str] = set()
+
+    results: Dict[pathlib.Path, Tuple[Optional[Dict], List[ValidationError]]] = {}
+    pending: List[Tuple[pathlib.Path, str, os.stat_result]] = []
+
+    # Find all markdown files in docs/
+    if paths is None:
+        md_paths = sorted(p for p in DOCS.rglob("*.md") if not should_exclude(p))
+    else:
+        md_paths = sorted(paths)
+    for md_path in md_paths:
+        rel_path = str(md_path.relative_to(ROOT)).replace("\\", "/")
+        seen.add(rel_path)
+
+        try:
+            st = md_path.stat()
+        except OSError as e:
+            results[md_path] = (
+                None,
+                [ValidationError(md_path, f"Failed to read file: {e}")],
+            )
             continue
 
-        # Validate front-matter
-        errors.extend(validate_frontmatter(md_path, meta))
-
-        # Build registry entry
-        entry: Dict[str, Any] = {
-            "path": str(md_path.relative_to(ROOT)).replace("\\", "/"),
-            "doc_id": meta.get("doc_id", ""),
-            "title": meta.get("title", ""),
-            "doc_type": meta.get("doc_type", ""),
-            "status": meta.get("status", ""),
-            "canonical": bool(meta.get("canonical", False)),
-            "tags": meta.get("tags", []),
-            "created": str(meta.get("created", "")),
-            "summary": meta.get("summary", ""),
-            "supersedes": meta.get("supersedes", []),
-            "related": meta.get("related", []),
-            "sha256": compute_sha256(content),
-            "simhash": compute_simhash(body),
-        }
-        entries.append(entry)
+        record = cache.lookup(rel_path, st) if cache else None
+        if record is not None:
+            results[md_path] = (
+                record["entry"],
+                RegistryCache.restore_errors(md_path, record),
+            )
+        else:
+            pending.append((md_path, rel_path, st))
+
+    pending_paths = [md_path for md_path, _, _ in pending]
+    previous = [
+        cache.files.get(rel_path) if cache else None for _, rel_path, _ in pending
+    ]
+
+    timed = timings is not None
+    if jobs > 1 and len(pending) > 1:
+        chunksize = max(1, len(pending) // (jobs * 4))
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Import simhash (or warn that it is missing) once, before forking
+        load_simhash()
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            processed = list(
+                pool.map(
+                    functools.partial(process_file, timed=timed),
+                    pending_paths,
+                    previous,
+                    chunksize=chunksize,
+                )
+            )
+    else:
+        parse_cache = ParseCache(PARSE_CACHE, ROOT) if use_cache else None
+        processed = [
+            process_file(
+                path, prev, defer_simhash=True, timed=timed, parse_cache=parse_cache
+            )
+            for path, prev in zip(pending_paths, previous)
+        ]
+        if parse_cache is not None and pending:
+            if paths is None:
+                parse_cache.prune(seen)
+            parse_cache.save()
+        deferred = [result for result in processed if result.simhash_text is not None]
+        with timed_stage(timings, "simhash (batch)"):
+            simhashes = compute_simhashes([result.simhash_text for result in deferred])
+        for result, simhash in zip(deferred, simhashes):
+            result.entry["simhash"] = simhash
+
+    for (md_path, rel_path, st), result in zip(pending, processed):
+        results[md_path] = (result.entry, result.errors)
+        if timings is not None and result.timings:
+            timings.add_file(rel_path, result.timings)
+        if cache and result.cacheable:
+            cache.store(rel_path, st, result.sha256, result.entry, result.errors)
+
+    for md_path in md_paths:
+        entry, file_errors = results[md_path]
+        errors.extend(file_errors)
+        if entry is not None:
+            entries.append(entry)
+
+    if cache:
+        # A partial run can't tell which files were deleted
+        if paths is None:
+            cache.prune(seen)
+        cache.save()
 
     return entries, errors
 
 
-def generate_registry(entries: List[Dict[str, Any]]) -> None:
-    """Generate machine-readable registry JSON."""
+def staged_git_paths(diff_filter: str) -> List[pathlib.Path]:
+    """Files staged in git with a change type in ``diff_filter``.
+
+    Renames are listed as a deletion of the old path and an addition of
+    the new one, so both can be handled.
+    """
+    result = subprocess.run(
+        [
+            "git",
+            "diff",
+            "--cached",
+            "--name-only",
+            "--no-renames",
+            f"--diff-filter={diff_filter}",
+            "-z",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    return [ROOT / name for name in result.stdout.split("\0") if name]
+
+
+def select_staged_documents(
+    staged: List[str],
+) -> Tuple[List[pathlib.Path], Set[str]]:
+    """Resolve staged paths to the docs that need validating.
+
+    Paths are taken as passed by pre-commit (relative to the working
+    directory); with none given, the staged files are read from git.
+    pre-commit only passes files that exist, so staged deletions
+    (including the old side of renames) are always read from git.
+    Returns the documents to validate and the repo-relative paths of every
+    staged file, so stale registry entries for them can be dropped.
+    """
+    if staged:
+        candidates = [pathlib.Path(p).resolve() for p in staged]
+        candidates += staged_git_paths("D")
+    else:
+        candidates = staged_git_paths("ACMRD")
+
+    md_paths: List[pathlib.Path] = []
+    staged_rel: Set[str] = set()
+    for path in candidates:
+        try:
+            rel_path = str(path.relative_to(ROOT)).replace("\\", "/")
+        except ValueError:
+            continue
+        staged_rel.add(rel_path)
+
+        if (
+            rel_path.startswith("docs/")
+            and path.suffix == ".md"
+            and path.is_file()
+            and not should_exclude(path)
+        ):
+            md_paths.append(path)
+
+    return md_paths, staged_rel
+
+
+def load_registry() -> Dict[str, Any]:
+    """Load the last generated registry, or an empty one."""
+    try:
+        with open(REGISTRY, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def read_previous_registry() -> Tuple[Optional[str], Optional[str]]:
+    """The current registry.json text and its generated_at, if readable."""
+    try:
+        with open(REGISTRY, encoding="utf-8", newline="") as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError):
+        return None, None
+    match = GENERATED_AT_RE.match(text)
+    return (text, match.group(1)) if match else (None, None)
+
+
+def generate_registry(entries: List[Dict[str, Any]], sqlite: bool = False) -> None:
+    """Generate machine-readable registry JSON.
+
+    With ``sqlite``, an indexed copy is also written to registry.sqlite
+    (see docs_registry.py). If the content is the same as the current
+    registry.json apart from generated_at, nothing is rewritten and the
+    old timestamp is kept.
+    """
     REGISTRY.parent.mkdir(parents=True, exist_ok=True)
 
     by_type: Dict[str, int] = {}
     by_status: Dict[str, int] = {}
 
+    generated_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    previous_text, previous_generated_at = read_previous_registry()
     registry: Dict[str, Any] = {
-        "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        # Serialized with the previous timestamp first, to compare content
+        "generated_at": previous_generated_at or generated_at,
         "total_docs": len(entries),
         "by_type": by_type,
         "by_status": by_status,
@@ -373,16 +1392,468 @@ def generate_registry(entries: List[Dict[str, Any]]) -> None:
         by_type[doc_type] = by_type.get(doc_type, 0) + 1
         by_status[status] = by_status.get(status, 0) + 1
 
-    with open(REGISTRY, "w", encoding="utf-8", newline="\n") as f:
-        json.dump(registry, f, indent=2, ensure_ascii=False)
-        f.write("\n")  # Ensure final newline
+    text = json.dumps(registry, indent=2, ensure_ascii=False) + "\n"
+    unchanged = text == previous_text
+    if not unchanged and previous_generated_at:
+        # generated_at is the first key, so only its value differs
+        registry["generated_at"] = generated_at
+        text = text.replace(
+            f'"generated_at": "{previous_generated_at}"',
+            f'"generated_at": "{generated_at}"',
+            1,
+        )
 
-    print(f"Registry generated: {REGISTRY.relative_to(ROOT)}")
+    if unchanged:
+        print(f"Registry unchanged: {REGISTRY.relative_to(ROOT)}")
+    else:
+        with open(REGISTRY, "w", encoding="utf-8", newline="\n") as f:
+            f.write(text)
+        print(f"Registry generated: {REGISTRY.relative_to(ROOT)}")
+
+    # Derived files are rewritten unless they were built from this very
+    # registry: an unchanged registry.json says nothing about a copy left
+    # behind by an earlier run (e.g. one without --sqlite)
+    if registry_index_generated_at() != registry["generated_at"]:
+        write_registry_index(registry["docs"], registry["generated_at"])
+    print(f"   Lookup index: {REGISTRY_INDEX.relative_to(ROOT)}")
+    if sqlite:
+        from docs_registry import registry_db_generated_at, write_registry_db
+
+        if registry_db_generated_at(REGISTRY_DB) != registry["generated_at"]:
+            write_registry_db(registry, REGISTRY_DB)
+        print(f"   SQLite copy: {REGISTRY_DB.relative_to(ROOT)}")
     print(f"   Total docs: {len(entries)}")
     print(f"   By type: {registry['by_type']}")
     print(f"   By status: {registry['by_status']}")
 
 
+def build_registry_index(
+    docs: List[Dict[str, Any]], generated_at: str
+) -> Dict[str, Any]:
+    """Inverted indexes over registry entries, keyed by registry path.
+
+    doc_ids are not unique across the tree, so postings hold paths and
+    ``by_doc_id`` maps each doc_id to its paths. Postings keep registry
+    order (newest first).
+    """
+    index: Dict[str, Any] = {
+        "generated_at": generated_at,
+        "docs": {},
+        "by_doc_id": {},
+        "by_tag": {},
+        "by_status": {},
+        "by_doc_type": {},
+        "by_concept": {},
+    }
+
+    def post(name: str, key: Any, path: str) -> None:
+        postings = index[name].setdefault(str(key), [])
+        if not postings or postings[-1] != path:
+            postings.append(path)
+
+    for entry in docs:
+        path = entry["path"]
+        index["docs"][path] = {
+            field: entry.get(field)
+            for field in ("doc_id", "title", "doc_type", "status", "canonical")
+        }
+        if entry.get("doc_id"):
+            post("by_doc_id", entry["doc_id"], path)
+        if isinstance(entry.get("tags"), list):
+            for tag in entry["tags"]:
+                post("by_tag", tag, path)
+        post("by_status", entry.get("status", ""), path)
+        post("by_doc_type", entry.get("doc_type", ""), path)
+        concept = concept_key(entry.get("title", ""))
+        if concept:
+            post("by_concept", concept, path)
+
+    return index
+
+
+def write_registry_index(docs: List[Dict[str, Any]], generated_at: str) -> Dict:
+    """Build registry-index.json from registry entries and write it."""
+    index = build_registry_index(docs, generated_at)
+    with open(REGISTRY_INDEX, "w", encoding="utf-8", newline="\n") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"), default=str)
+        f.write("\n")
+    return index
+
+
+def registry_index_generated_at() -> Optional[str]:
+    """generated_at recorded in registry-index.json, if readable.
+
+    It is the first key, so only the start of the file is read.
+    """
+    try:
+        with open(REGISTRY_INDEX, encoding="utf-8") as f:
+            match = GENERATED_AT_RE.match(f.read(256))
+    except (OSError, UnicodeDecodeError):
+        return None
+    return match.group(1) if match else None
+
+
+def load_registry_index() -> Dict[str, Any]:
+    """Read registry-index.json, rebuilding it if it is missing or stale.
+
+    The index is derived from registry.json and not committed, so a fresh
+    clone (or a registry updated by someone else) has none, or an older
+    one; it is rebuilt from the committed registry when generated_at
+    differs. Raises OSError or ValueError if registry.json can't be read.
+    """
+    with open(REGISTRY, encoding="utf-8") as f:
+        registry = json.load(f)
+    try:
+        with open(REGISTRY_INDEX, encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("generated_at") == registry.get("generated_at"):
+            return index
+    except (OSError, ValueError):
+        pass
+    return write_registry_index(registry.get("docs", []), registry.get("generated_at"))
+
+
+def query_registry_index(
+    index: Dict[str, Any], filters: Dict[str, Optional[str]]
+) -> List[str]:
+    """Paths matching every given filter (by_tag, by_status, ...).
+
+    Each filter is a dict lookup; results are intersected in registry order.
+    """
+    matches: Optional[List[str]] = None
+    for name, value in filters.items():
+        if value is None:
+            continue
+        if name == "by_concept":
+            value = concept_key(value)
+        postings = index[name].get(value, [])
+        if matches is None:
+            matches = postings
+        else:
+            wanted = set(postings)
+            matches = [path for path in matches if path in wanted]
+    return list(index["docs"]) if matches is None else matches
+
+
+def run_query(args) -> None:
+    """The ``query`` subcommand: look documents up in registry-index.json."""
+    try:
+        index = load_registry_index()
+    except (OSError, ValueError) as e:
+        print(f"Cannot read {REGISTRY.relative_to(ROOT)}: {e}")
+        print("Generate it with: python scripts/validate_docs.py")
+        sys.exit(2)
+
+    paths = query_registry_index(
+        index,
+        {
+            "by_doc_id": args.doc_id,
+            "by_tag": args.tag,
+            "by_status": args.status,
+            "by_doc_type": args.doc_type,
+            "by_concept": args.concept,
+        },
+    )
+
+    if args.json:
+        print(
+            json.dumps(
+                [{"path": path, **index["docs"][path]} for path in paths],
+                indent=2,
+                ensure_ascii=False,
+            )
+        )
+    else:
+        for path in paths:
+            doc = index["docs"][path]
+            canonical = " (canonical)" if doc.get("canonical") else ""
+            print(f"{path}  [{doc.get('status')}] {doc.get('title')}{canonical}")
+    sys.exit(0 if paths else 1)
+
+
+def print_errors(errors: List[ValidationError]) -> Dict[str, List[ValidationError]]:
+    """Print errors grouped by severity and return the groups."""
+    by_severity: Dict[str, List[ValidationError]] = {
+        "error": [],
+        "warning": [],
+        "info": [],
+    }
+    for error in errors:
+        by_severity[error.severity].append(error)
+
+    for severity in ["error", "warning", "info"]:
+        if by_severity[severity]:
+            print(f"{severity.upper()}S ({len(by_severity[severity])}):")
+            for error in by_severity[severity]:
+                print(f"  {error}")
+            print()
+
+    return by_severity
+
+
+# Watch mode: quiet period that batches editor save bursts, polling
+# interval without watchdog, and delay before rewriting the registry
+WATCH_DEBOUNCE = 0.05
+WATCH_POLL_INTERVAL = 0.5
+WATCH_REGISTRY_DELAY = 2.0
+
+# watchdog events that can mean new content; opened/closed-without-write
+# events are caused by our own reads
+WATCH_EVENT_TYPES = {"created", "modified", "deleted", "moved", "closed"}
+
+
+def is_watched(path: pathlib.Path) -> bool:
+    """Whether watch mode validates ``path``: corpus docs and inbox drafts."""
+    if path.suffix != ".md" or not is_inside(path, DOCS):
+        return False
+    return "/_inbox/" in path.as_posix() or not should_exclude(path)
+
+
+def is_inside(path: pathlib.Path, parent: pathlib.Path) -> bool:
+    try:
+        path.relative_to(parent)
+        return True
+    except ValueError:
+        return False
+
+
+class DocsWatcher:
+    """In-memory corpus for --watch, updated one changed file at a time.
+
+    Entries, per-file errors and the near-duplicate indexes are kept between
+    updates, so a change only costs processing the changed files and
+    checking them against the rest. Inbox drafts are validated too and
+    checked for near-duplicates, but stay out of the registry.
+    """
+
+    def __init__(self, use_cache: bool, jobs: int, write_registry: bool, sqlite: bool):
+        self.use_cache = use_cache
+        self.jobs = jobs
+        self.write_registry = write_registry
+        self.sqlite = sqlite
+
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.errors: Dict[str, List[ValidationError]] = {}
+        self.index = SimhashIndex()
+        self.chunks = ChunkIndex()
+        self.keys: Dict[str, int] = {}  # Corpus path -> index key
+        self.corpus: Dict[int, Dict[str, Any]] = {}  # Index key -> entry
+        self.concepts = ConceptIndex()
+        self.registry_due: Optional[float] = None
+
+    def load(self) -> List[ValidationError]:
+        """Process the whole tree once; returns the initial errors."""
+        entries, errors = process_documents(use_cache=self.use_cache, jobs=self.jobs)
+        inbox_entries, inbox_errors = process_documents(
+            use_cache=self.use_cache,
+            jobs=self.jobs,
+            paths=sorted(p for p in INBOX.rglob("*.md") if is_watched(p)),
+        )
+        for entry in entries + inbox_entries:
+            self._set_entry(entry["path"], entry)
+        for error in errors + inbox_errors:
+            self.errors.setdefault(self._rel(error.path), []).append(error)
+
+        all_errors = errors + inbox_errors
+        all_errors.extend(validate_canonical_uniqueness(self.corpus_entries()))
+        all_errors.extend(self._near_duplicates(sorted(self.entries)))
+        return all_errors
+
+    @staticmethod
+    def _rel(path: pathlib.Path) -> str:
+        return str(path.relative_to(ROOT)).replace("\\", "/")
+
+    def corpus_entries(self) -> List[Dict[str, Any]]:
+        """Corpus entries in path order, as a full run would produce them."""
+        return [
+            self.entries[rel_path]
+            for rel_path in sorted(self.entries)
+            if "/_inbox/" not in rel_path
+        ]
+
+    def _set_entry(self, rel_path: str, entry: Optional[Dict[str, Any]]) -> None:
+        self._drop_entry(rel_path)
+        if entry is None:
+            return
+        self.entries[rel_path] = entry
+        self.concepts.update(rel_path, entry)
+        if "/_inbox/" not in rel_path:
+            key = self.keys.setdefault(rel_path, len(self.keys))
+            if entry.get("simhash"):
+                self.index.add(key, int(entry["simhash"]))
+            self.chunks.add(key, entry.get("chunks") or [])
+            self.corpus[key] = entry
+
+    def _drop_entry(self, rel_path: str) -> None:
+        self.entries.pop(rel_path, None)
+        self.concepts.discard(rel_path)
+        key = self.keys.get(rel_path)
+        if key is not None:
+            self.index.remove(key)
+            self.chunks.remove(key)
+            self.corpus.pop(key, None)
+
+    def _near_duplicates(self, rel_paths: List[str]) -> List[ValidationError]:
+        inbox_entries = [
+            self.entries[rel_path]
+            for rel_path in rel_paths
+            if "/_inbox/" in rel_path and rel_path in self.entries
+        ]
+        errors = find_near_duplicates(inbox_entries, self.index, self.corpus)
+        errors.extend(find_shared_sections(inbox_entries, self.chunks, self.corpus))
+        return errors
+
+    def update(self, paths: Set[pathlib.Path]) -> None:
+        """Revalidate changed files and print what they report."""
+        start = time.perf_counter()
+        changed: Set[str] = set()
+        removed: Set[str] = set()
+        for path in sorted(paths):
+            if not is_watched(path):
+                continue
+            rel_path = self._rel(path)
+            changed.add(rel_path)
+            if path.is_file():
+                result = process_file(path)
+                self.errors[rel_path] = result.errors
+                self._set_entry(rel_path, result.entry)
+            else:
+                removed.add(rel_path)
+                self.errors.pop(rel_path, None)
+                self._drop_entry(rel_path)
+        if not changed:
+            return
+
+        errors = [
+            error
+            for rel_path in sorted(changed)
+            for error in self.errors.get(rel_path, [])
+        ]
+        errors.extend(self.concepts.conflicts(changed))
+        errors.extend(self._near_duplicates(sorted(changed)))
+
+        elapsed = (time.perf_counter() - start) * 1000
+        stamp = datetime.now().strftime("%H:%M:%S")
+        print(f"[{stamp}] Revalidated {len(changed)} file(s) in {elapsed:.0f} ms")
+        for rel_path in sorted(changed):
+            # Edited files without front-matter have no entry either
+            print(f"  {rel_path}{' (removed)' if rel_path in removed else ''}")
+        print()
+        if errors:
+            print_errors(errors)
+        else:
+            print("OK")
+            print()
+
+        if self.write_registry:
+            self.registry_due = time.monotonic() + WATCH_REGISTRY_DELAY
+
+    def flush_registry(self, force: bool = False) -> None:
+        """Rewrite registry.json once changes have settled."""
+        if self.registry_due is None:
+            return
+        if force or time.monotonic() >= self.registry_due:
+            self.registry_due = None
+            generate_registry(self.corpus_entries(), sqlite=self.sqlite)
+            print()
+
+
+def start_observer(changes: "queue.Queue[pathlib.Path]") -> Any:
+    """Start a watchdog observer feeding changed paths, or None without it."""
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory or event.event_type not in WATCH_EVENT_TYPES:
+                return
+            for path in (event.src_path, getattr(event, "dest_path", "")):
+                if path:
+                    changes.put(pathlib.Path(os.fsdecode(path)))
+
+    observer = Observer()
+    observer.schedule(Handler(), str(DOCS), recursive=True)
+    observer.start()
+    return observer
+
+
+def collect_changes(changes: "queue.Queue[pathlib.Path]") -> Set[pathlib.Path]:
+    """Wait briefly for a change, then gather the rest of its burst."""
+    try:
+        paths = {changes.get(timeout=0.2)}
+    except queue.Empty:
+        return set()
+
+    deadline = time.monotonic() + WATCH_DEBOUNCE
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return paths
+        try:
+            paths.add(changes.get(timeout=remaining))
+        except queue.Empty:
+            return paths
+
+
+def snapshot_docs() -> Dict[pathlib.Path, Tuple[int, int]]:
+    """(mtime_ns, size) of every markdown file under docs/, for polling."""
+    snapshot = {}
+    for path in DOCS.rglob("*.md"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        snapshot[path] = (st.st_mtime_ns, st.st_size)
+    return snapshot
+
+
+def watch_documents(watcher: DocsWatcher) -> None:
+    """Revalidate changed documents until interrupted."""
+    print("Validating documentation...")
+    print()
+    errors = watcher.load()
+    if errors:
+        print_errors(errors)
+
+    changes: queue.Queue[pathlib.Path] = queue.Queue()
+    observer = start_observer(changes)
+    snapshot: Dict[pathlib.Path, Tuple[int, int]] = {}
+    if observer is None:
+        print("WARNING: watchdog not installed. Polling for changes.")
+        print("To enable file system events: pip install watchdog")
+        snapshot = snapshot_docs()
+
+    print(f"Watching {DOCS.relative_to(ROOT)}/ for changes (Ctrl+C to stop)...")
+    print()
+    try:
+        while True:
+            if observer is None:
+                time.sleep(WATCH_POLL_INTERVAL)
+                current = snapshot_docs()
+                paths = {
+                    path
+                    for path in current.keys() | snapshot.keys()
+                    if current.get(path) != snapshot.get(path)
+                }
+                snapshot = current
+            else:
+                paths = collect_changes(changes)
+
+            if paths:
+                watcher.update(paths)
+            watcher.flush_registry()
+    except KeyboardInterrupt:
+        print("Stopping watch mode.")
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
+        watcher.flush_registry(force=True)
+
+
 def main():
     import argparse
 
@@ -394,42 +1865,191 @@ def main():
         action="store_true",
         help="Pre-commit mode: validate only, don't regenerate registry",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Ignore and don't update the registry cache ({CACHE.name})",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Parse documents in N worker processes (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--staged",
+        nargs="*",
+        metavar="PATH",
+        help="Validate only these files (default: staged files from git), "
+        "checking them against the corpus in registry.json. Implies --pre-commit",
+    )
+    parser.add_argument(
+        "--dedupe-corpus",
+        action="store_true",
+        help="Also report clusters of near-duplicate documents and documents "
+        "sharing sections across the whole corpus, not just inbox drafts",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and revalidate documents as they change "
+        "(uses watchdog if installed, otherwise polls)",
+    )
+    parser.add_argument(
+        "--sqlite",
+        action="store_true",
+        help=f"Also write an indexed SQLite copy of the registry ({REGISTRY_DB.name})",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print per-stage timings and the slowest files",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Write a JSON trace of stages and per-file phases "
+        "(Chrome trace event format). Implies --timings",
+    )
+    parser.add_argument(
+        "--slowest",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Number of files in the --timings table (default: 10)",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    query = subparsers.add_parser(
+        "query",
+        help="Look up documents in the registry index instead of validating",
+        description="Look up documents in docs/index/registry-index.json. "
+        "Filters are combined; exits 1 if nothing matches.",
+    )
+    query.add_argument("--doc-id", help="Documents with this doc_id")
+    query.add_argument("--tag", help="Documents with this tag")
+    query.add_argument("--status", help="Documents with this status")
+    query.add_argument("--doc-type", help="Documents of this doc_type")
+    query.add_argument(
+        "--concept", help="Documents whose normalized title matches this title"
+    )
+    query.add_argument("--json", action="store_true", help="Print matches as JSON")
+
     args = parser.parse_args()
+    if args.command == "query":
+        run_query(args)
+    if args.watch and args.staged is not None:
+        parser.error("--watch cannot be combined with --staged")
+
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    if args.staged is not None:
+        args.pre_commit = True
+    timings = Timings() if args.timings or args.profile else None
+
+    if args.watch:
+        watch_documents(
+            DocsWatcher(
+                use_cache=not args.no_cache,
+                jobs=jobs,
+                write_registry=not args.pre_commit,
+                sqlite=args.sqlite,
+            )
+        )
+        return
 
     print("Validating documentation...")
     print()
 
-    # Process all documents
-    entries, errors = process_documents()
+    if args.staged is not None:
+        # Process staged documents only; the rest of the corpus comes from
+        # the registry
+        with timed_stage(timings, "select staged documents"):
+            md_paths, staged_rel = select_staged_documents(args.staged)
+        cache: Optional[RegistryCache] = None
+        if not args.no_cache:
+            cache = RegistryCache()
+            cache.load()
+            for rel_path in staged_rel:
+                if not (ROOT / rel_path).exists():
+                    cache.forget(rel_path)
+        with timed_stage(timings, "process documents"):
+            staged_entries, errors = process_documents(
+                use_cache=not args.no_cache,
+                jobs=jobs,
+                paths=md_paths,
+                timings=timings,
+                cache=cache,
+            )
+        with timed_stage(timings, "load registry"):
+            # The registry is not regenerated on commit, so it can still list
+            # files deleted or renamed since; those entries are dropped
+            registry = load_registry()
+            entries = [
+                e
+                for e in registry.get("docs", [])
+                if e["path"] not in staged_rel and (ROOT / e["path"]).is_file()
+            ] + staged_entries
+            if cache is not None and cache.complete:
+                cache.sync_concepts(entries, registry.get("generated_at"))
+        changed: Optional[Set[str]] = {e["path"] for e in staged_entries}
+        print(f"Staged mode: {len(md_paths)} document(s) to validate")
+        print()
+    else:
+        # Process all documents
+        with timed_stage(timings, "process documents"):
+            entries, errors = process_documents(
+                use_cache=not args.no_cache, jobs=jobs, timings=timings
+            )
+        changed = None
+        cache = None
 
     # Additional validations
-    errors.extend(validate_canonical_uniqueness(entries))
-    errors.extend(detect_near_duplicates(entries))
+    with timed_stage(timings, "canonical uniqueness"):
+        if changed is not None and cache is not None and cache.complete:
+            # Only the staged titles were normalized, by the cache. It can
+            # still hold files deleted or renamed without a staged run
+            # seeing it (e.g. a commit made with --no-verify), so the other
+            # docs of each conflict are checked on disk first
+            for rel_path in cache.concepts.related(changed):
+                if not (ROOT / rel_path).is_file():
+                    cache.forget(rel_path)
+            cache.save()
+            errors.extend(cache.concepts.conflicts(changed))
+        else:
+            errors.extend(validate_canonical_uniqueness(entries, changed))
+    with timed_stage(timings, "near-duplicates"):
+        errors.extend(detect_near_duplicates(entries))
+    with timed_stage(timings, "shared sections"):
+        errors.extend(detect_shared_sections(entries))
+    if args.dedupe_corpus:
+        with timed_stage(timings, "near-duplicate clusters"):
+            errors.extend(find_duplicate_clusters(entries))
+        with timed_stage(timings, "shared section pairs"):
+            errors.extend(find_shared_section_pairs(entries))
 
     # Generate registry (skip in pre-commit mode to avoid infinite loop)
     if not args.pre_commit:
-        generate_registry(entries)
+        with timed_stage(timings, "generate registry"):
+            generate_registry(entries, sqlite=args.sqlite)
         print()
     else:
         print("(Pre-commit mode: skipping registry regeneration)")
         print()
 
+    if timings:
+        timings.print_report(args.slowest)
+        if args.profile:
+            timings.write_trace(pathlib.Path(args.profile))
+            print(f"Profile trace written to {args.profile}")
+            print()
+
     # Report errors
     if errors:
         print("Validation failed:")
         print()
-
-        # Group by severity
-        by_severity = {"error": [], "warning": [], "info": []}
-        for error in errors:
-            by_severity[error.severity].append(error)
-
-        for severity in ["error", "warning", "info"]:
-            if by_severity[severity]:
-                print(f"{severity.upper()}S ({len(by_severity[severity])}):")
-                for error in by_severity[severity]:
-                    print(f"  {error}")
-                print()
+        by_severity = print_errors(errors)
 
         # Exit with failure if errors exist
         if by_severity["error"]: